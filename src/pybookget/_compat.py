@@ -0,0 +1,8 @@
+"""Compatibility helpers for supported Python versions."""
+
+import sys
+
+# Keyword arguments for @dataclass that enable __slots__ where supported.
+# dataclass(slots=True) requires Python 3.10+; older versions fall back to
+# regular __dict__-based instances with identical behavior.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
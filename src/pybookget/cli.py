@@ -53,17 +53,28 @@ def cli(ctx, version):
 @click.option('--max-retries', default=3, help='Maximum retry attempts')
 @click.option('--retry-wait-min', default=1.0, help='Minimum wait between retries (seconds)')
 @click.option('--retry-wait-max', default=10.0, help='Maximum wait between retries (seconds)')
+@click.option(
+    '--rps',
+    default=0.0,
+    help='Max download requests per second per host (default: unlimited)',
+)
 @click.option('--cookie-file', help='Path to cookie file (Netscape format)')
 @click.option('--header-file', help='Path to header file')
 @click.option('--proxy', help='HTTP/HTTPS proxy')
 @click.option('--user-agent', '-U', help='Custom user agent')
 @click.option('--no-fake-user-agent', is_flag=True, help='Disable random user agent masking')
 @click.option('--no-ssl-verify', is_flag=True, help='Disable SSL verification')
+@click.option('--keepalive', default=0, help='Idle connections kept open for reuse (default: 0)')
 @click.option('--quality', default=80, help='JPEG quality (1-100)')
 @click.option('--iiif-quality', default='default', help='IIIF quality: default, color, gray, bitonal')
 @click.option('--iiif-format', default='jpg', help='IIIF format: jpg, png, webp, tif')
 @click.option('--skip-images', is_flag=True, help='Skip image downloads (metadata always downloaded)')
 @click.option('--skip-ocr', is_flag=True, help='Skip OCR downloads (metadata always downloaded)')
+@click.option(
+    '--force-ocr',
+    is_flag=True,
+    help='Download OCR without probing for availability first',
+)
 @click.option('--verbose', is_flag=True, help='Enable verbose logging')
 def download(
     url: str,
@@ -77,17 +88,20 @@ def download(
     max_retries: int,
     retry_wait_min: float,
     retry_wait_max: float,
+    rps: float,
     cookie_file: Optional[str],
     header_file: Optional[str],
     proxy: Optional[str],
     user_agent: Optional[str],
     no_fake_user_agent: bool,
     no_ssl_verify: bool,
+    keepalive: int,
     quality: int,
     iiif_quality: str,
     iiif_format: str,
     skip_images: bool,
     skip_ocr: bool,
+    force_ocr: bool,
     verbose: bool,
 ):
     """Download a book from a URL.
@@ -112,16 +126,19 @@ def download(
         max_retries=max_retries,
         retry_wait_min=retry_wait_min,
         retry_wait_max=retry_wait_max,
+        requests_per_second=rps,
         cookie_file=cookie_file,
         header_file=header_file,
         proxy=proxy,
         use_fake_user_agent=not no_fake_user_agent,
         verify_ssl=not no_ssl_verify,
+        max_keepalive_connections=keepalive,
         quality=quality,
         iiif_quality=iiif_quality,
         iiif_format=iiif_format,
         skip_images=skip_images,
         skip_ocr=skip_ocr,
+        force_ocr=force_ocr,
     )
 
     if user_agent:
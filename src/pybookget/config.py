@@ -40,6 +40,7 @@ class Config:
     )
     proxy: Optional[str] = None
     verify_ssl: bool = False  # Match Go's InsecureSkipVerify
+    max_keepalive_connections: int = 0  # Idle connections kept for reuse (0 = no keep-alive)
 
     # Retry settings (using tenacity)
     max_retries: int = 3  # Maximum number of retry attempts
@@ -60,6 +61,7 @@ class Config:
 
     # Rate limiting
     sleep_interval: int = 0  # Seconds between downloads
+    requests_per_second: float = 0  # Max download requests per second per host (0 = unlimited)
 
     # Downloader mode
     downloader_mode: int = 0  # 0=default, 1=batch image, 2=IIIF
@@ -70,6 +72,7 @@ class Config:
     # Download control flags
     skip_images: bool = False  # Skip image downloads (metadata always downloaded)
     skip_ocr: bool = False  # Skip OCR downloads (metadata always downloaded)
+    force_ocr: bool = False  # Skip the OCR availability probe and always enqueue OCR tasks
 
     def __post_init__(self):
         """Initialize and validate configuration."""
@@ -7,8 +7,17 @@ used by digital libraries and archives for structural metadata.
 Supports MODS metadata extraction and physical structure parsing.
 """
 
-from typing import Optional
-from xml.etree import ElementTree as ET
+import io
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, List, Optional, Sequence, Union
+
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    from xml.etree import ElementTree as ET
+    LXML_AVAILABLE = False
 
 from pybookget.formats.base import MetadataParser
 from pybookget.models.mets import (
@@ -20,6 +29,173 @@ from pybookget.models.mets import (
 )
 
 
+if LXML_AVAILABLE:
+    # METS needs no xml:id table or entity expansion, is full of
+    # whitespace-only text nodes, and large records can exceed libxml2's
+    # default tree limits
+    _PARSER_OPTIONS = {
+        'collect_ids': False,
+        'huge_tree': True,
+        'remove_blank_text': True,
+        'resolve_entities': False,
+    }
+    _PARSER = ET.XMLParser(**_PARSER_OPTIONS)
+    # str input is re-encoded as UTF-8 (lxml rejects str with an encoding
+    # declaration), so force that encoding over whatever the prolog says
+    _STR_PARSER = ET.XMLParser(encoding='utf-8', **_PARSER_OPTIONS)
+
+
+def _fromstring(data: Union[str, bytes]) -> ET.Element:
+    """Parse an XML document with lxml if installed, else ElementTree.
+
+    Args:
+        data: Raw XML content
+
+    Returns:
+        Root element
+    """
+    if LXML_AVAILABLE:
+        if isinstance(data, str):
+            return ET.fromstring(data.encode('utf-8'), _STR_PARSER)
+        return ET.fromstring(data, _PARSER)
+    return ET.fromstring(data)
+
+
+def _findall(path: str, elem: Any) -> List[Any]:
+    """ElementTree fallback for a compiled path (see _compile)."""
+    return elem.findall(path, METS_NAMESPACES)
+
+
+def _compile(path: str) -> Callable[[Any], List[Any]]:
+    """Compile a namespaced path once for reuse on every document.
+
+    Args:
+        path: Path expression valid in both XPath and ElementPath
+
+    Returns:
+        Callable taking an element and returning the matching elements
+    """
+    if LXML_AVAILABLE:
+        return ET.XPath(path, namespaces=METS_NAMESPACES)
+    return partial(_findall, path)
+
+
+def _first(xpath: Callable[[Any], List[Any]], elem: Any) -> Optional[Any]:
+    """Return the first element matched by a compiled path, or None."""
+    found = xpath(elem)
+    return found[0] if found else None
+
+
+def _unwrap_oai(root: Any) -> Any:
+    """Return the mets:mets element of an OAI-PMH response, else root."""
+    oai_record = _first(_XP_OAI_METS, root)
+    return oai_record if oai_record is not None else root
+
+
+# Paths follow the fixed METS layout with child steps, so a lookup does not
+# walk the whole document. Descendant steps remain only where nesting varies
+# (fileGrp may nest, page divs sit at any depth of the physical structMap)
+_XP_OAI_METS = _compile('oai:*/oai:record/oai:metadata/mets:mets')
+_XP_METS_HDR = _compile('mets:metsHdr')
+_XP_FILE_SEC = _compile('mets:fileSec')
+_XP_STRUCT_MAP = _compile('mets:structMap')
+_XP_MODS = _compile('mets:dmdSec/mets:mdWrap/mets:xmlData/mods:mods')
+_XP_TITLE = _compile('mods:titleInfo/mods:title')
+_XP_AUTHOR = _compile('mods:name[@type="personal"]/mods:namePart')
+_XP_DATE = _compile('mods:originInfo/mods:dateIssued')
+_XP_FILE_GRP = _compile('.//mets:fileGrp')
+_XP_FILE = _compile('mets:file')
+_XP_PHYS_STRUCT = _compile('mets:structMap[@TYPE="PHYSICAL"]')
+_XP_PAGE_DIV = _compile('.//mets:div[@TYPE="page"]')
+
+# Per-element lookups (one FLocat per file, fptrs per page) walk the subtree
+# with a tag filter instead of setting up an XPath evaluation for each element
+_METS_NS = '{' + METS_NAMESPACES['mets'] + '}'
+_FLOCAT_TAG = _METS_NS + 'FLocat'
+_FPTR_TAG = _METS_NS + 'fptr'
+_XLINK_HREF = '{' + METS_NAMESPACES['xlink'] + '}href'
+
+# METSMetadata attribute -> compiled MODS path of its element
+_MODS_FIELDS = (
+    ('title', _XP_TITLE),
+    ('subtitle', _compile('mods:titleInfo/mods:subTitle')),
+    ('author', _XP_AUTHOR),
+    ('publisher', _compile('mods:originInfo/mods:publisher')),
+    ('date', _XP_DATE),
+    ('language', _compile('mods:language/mods:languageTerm')),
+    ('extent', _compile('mods:physicalDescription/mods:extent')),
+    ('doi', _compile('mods:identifier[@type="doi"]')),
+    ('license', _compile('mods:accessCondition')),
+)
+
+_MODS_TAG = '{' + METS_NAMESPACES['mods'] + '}mods'
+_FILE_GRP_TAG = _METS_NS + 'fileGrp'
+_FILE_TAG = _METS_NS + 'file'
+_STRUCT_MAP_TAG = _METS_NS + 'structMap'
+_DIV_TAG = _METS_NS + 'div'
+
+
+def _parse_mods(mods: Any) -> METSMetadata:
+    """Build METSMetadata from a mods:mods element."""
+    metadata = METSMetadata()
+
+    # First matching element per field (title, author, DOI, ...)
+    for name, xpath in _MODS_FIELDS:
+        found = xpath(mods)
+        if found and found[0].text:
+            setattr(metadata, name, found[0].text.strip())
+
+    return metadata
+
+
+def _parse_file(file_elem: Any, use: Optional[str]) -> Optional[METSFile]:
+    """Build a METSFile from a mets:file element.
+
+    Args:
+        file_elem: mets:file element
+        use: USE attribute of the enclosing mets:fileGrp
+
+    Returns:
+        METSFile, or None if the element has no ID or no FLocat
+    """
+    file_id = file_elem.get('ID')
+    if not file_id:
+        return None
+
+    flocat = next(file_elem.iter(_FLOCAT_TAG), None)
+    if flocat is None:
+        return None
+
+    return METSFile(
+        id=file_id,
+        mimetype=file_elem.get('MIMETYPE', ''),
+        href=flocat.get(_XLINK_HREF, ''),
+        use=use
+    )
+
+
+def _parse_page(div: Any) -> METSPage:
+    """Build a METSPage from a page mets:div element."""
+    try:
+        order = int(div.get('ORDER', '0'))
+    except (ValueError, TypeError):
+        order = 0
+
+    # Extract file pointers
+    file_ids = []
+    for fptr in div.iter(_FPTR_TAG):
+        file_id = fptr.get('FILEID')
+        if file_id:
+            file_ids.append(file_id)
+
+    return METSPage(
+        id=div.get('ID', ''),
+        label=div.get('LABEL', ''),
+        order=order,
+        file_ids=file_ids
+    )
+
+
 class METSParser(MetadataParser[str, METSDocument]):
     """Parser for METS XML documents.
 
@@ -50,12 +226,8 @@ class METSParser(MetadataParser[str, METSDocument]):
             ValueError: If XML is malformed or not valid METS
         """
         try:
-            root = ET.fromstring(data)
-
             # Handle OAI wrapper if present
-            oai_record = root.find('.//oai:record/oai:metadata/mets:mets', METS_NAMESPACES)
-            if oai_record is not None:
-                root = oai_record
+            root = _unwrap_oai(_fromstring(data))
 
             # Parse metadata (MODS)
             metadata = self._parse_mods_metadata(root)
@@ -86,20 +258,20 @@ class METSParser(MetadataParser[str, METSDocument]):
             True if valid METS XML, False otherwise
         """
         try:
-            root = ET.fromstring(data)
+            root = _fromstring(data)
 
             # Check for METS namespace
             if 'mets' not in root.tag and 'METS' not in root.tag:
                 # Check if wrapped in OAI
-                oai_record = root.find('.//oai:record/oai:metadata/mets:mets', METS_NAMESPACES)
-                if oai_record is None:
+                root = _first(_XP_OAI_METS, root)
+                if root is None:
                     return False
 
             # Check for required METS sections
             # At minimum, should have metsHdr, fileSec, or structMap
-            if root.find('.//mets:metsHdr', METS_NAMESPACES) is None:
-                if root.find('.//mets:fileSec', METS_NAMESPACES) is None:
-                    if root.find('.//mets:structMap', METS_NAMESPACES) is None:
+            if not _XP_METS_HDR(root):
+                if not _XP_FILE_SEC(root):
+                    if not _XP_STRUCT_MAP(root):
                         return False
 
             return True
@@ -135,8 +307,8 @@ class METSParser(MetadataParser[str, METSDocument]):
             ValueError: If not a valid OAI-PMH response with METS
         """
         try:
-            root = ET.fromstring(data)
-            oai_record = root.find('.//oai:record/oai:metadata/mets:mets', METS_NAMESPACES)
+            root = _fromstring(data)
+            oai_record = _first(_XP_OAI_METS, root)
 
             if oai_record is None:
                 raise ValueError("No METS document found in OAI-PMH response")
@@ -150,122 +322,38 @@ class METSParser(MetadataParser[str, METSDocument]):
 
     def _parse_mods_metadata(self, root: ET.Element) -> METSMetadata:
         """Extract MODS metadata from METS root."""
-        metadata = METSMetadata()
-
         # Find MODS section
-        mods = root.find('.//mods:mods', METS_NAMESPACES)
+        mods = _first(_XP_MODS, root)
         if mods is None:
-            return metadata
-
-        # Title
-        title_elem = mods.find('.//mods:titleInfo/mods:title', METS_NAMESPACES)
-        if title_elem is not None and title_elem.text:
-            metadata.title = title_elem.text.strip()
-
-        # Subtitle
-        subtitle_elem = mods.find('.//mods:titleInfo/mods:subTitle', METS_NAMESPACES)
-        if subtitle_elem is not None and subtitle_elem.text:
-            metadata.subtitle = subtitle_elem.text.strip()
-
-        # Author
-        author_elem = mods.find('.//mods:name[@type="personal"]/mods:namePart', METS_NAMESPACES)
-        if author_elem is not None and author_elem.text:
-            metadata.author = author_elem.text.strip()
-
-        # Publisher
-        publisher_elem = mods.find('.//mods:originInfo/mods:publisher', METS_NAMESPACES)
-        if publisher_elem is not None and publisher_elem.text:
-            metadata.publisher = publisher_elem.text.strip()
-
-        # Date
-        date_elem = mods.find('.//mods:originInfo/mods:dateIssued', METS_NAMESPACES)
-        if date_elem is not None and date_elem.text:
-            metadata.date = date_elem.text.strip()
-
-        # Language
-        lang_elem = mods.find('.//mods:language/mods:languageTerm', METS_NAMESPACES)
-        if lang_elem is not None and lang_elem.text:
-            metadata.language = lang_elem.text.strip()
-
-        # Extent
-        extent_elem = mods.find('.//mods:physicalDescription/mods:extent', METS_NAMESPACES)
-        if extent_elem is not None and extent_elem.text:
-            metadata.extent = extent_elem.text.strip()
-
-        # DOI
-        doi_elem = mods.find('.//mods:identifier[@type="doi"]', METS_NAMESPACES)
-        if doi_elem is not None and doi_elem.text:
-            metadata.doi = doi_elem.text.strip()
-
-        # License
-        license_elem = mods.find('.//mods:accessCondition', METS_NAMESPACES)
-        if license_elem is not None and license_elem.text:
-            metadata.license = license_elem.text.strip()
-
-        return metadata
+            return METSMetadata()
+
+        return _parse_mods(mods)
 
     def _parse_file_section(self, root: ET.Element) -> dict[str, METSFile]:
         """Parse file section to extract file references."""
         files = {}
 
-        file_sec = root.find('.//mets:fileSec', METS_NAMESPACES)
+        file_sec = _first(_XP_FILE_SEC, root)
         if file_sec is None:
             return files
 
-        for file_grp in file_sec.findall('.//mets:fileGrp', METS_NAMESPACES):
+        for file_grp in _XP_FILE_GRP(file_sec):
             use = file_grp.get('USE')
 
-            for file_elem in file_grp.findall('.//mets:file', METS_NAMESPACES):
-                file_id = file_elem.get('ID')
-                mimetype = file_elem.get('MIMETYPE', '')
-
-                flocat = file_elem.find('.//mets:FLocat', METS_NAMESPACES)
-                if flocat is not None:
-                    href = flocat.get('{http://www.w3.org/1999/xlink}href', '')
-
-                    if file_id:
-                        files[file_id] = METSFile(
-                            id=file_id,
-                            mimetype=mimetype,
-                            href=href,
-                            use=use
-                        )
+            for file_elem in _XP_FILE(file_grp):
+                mets_file = _parse_file(file_elem, use)
+                if mets_file is not None:
+                    files[mets_file.id] = mets_file
 
         return files
 
     def _parse_physical_structure(self, root: ET.Element) -> list[METSPage]:
         """Parse physical structure map to extract page information."""
-        pages = []
-
-        phys_struct = root.find('.//mets:structMap[@TYPE="PHYSICAL"]', METS_NAMESPACES)
+        phys_struct = _first(_XP_PHYS_STRUCT, root)
         if phys_struct is None:
-            return pages
+            return []
 
-        for div in phys_struct.findall('.//mets:div[@TYPE="page"]', METS_NAMESPACES):
-            page_id = div.get('ID', '')
-            label = div.get('LABEL', '')
-            order_str = div.get('ORDER', '0')
-
-            try:
-                order = int(order_str)
-            except (ValueError, TypeError):
-                order = 0
-
-            # Extract file pointers
-            file_ids = []
-            for fptr in div.findall('.//mets:fptr', METS_NAMESPACES):
-                file_id = fptr.get('FILEID')
-                if file_id:
-                    file_ids.append(file_id)
-
-            pages.append(METSPage(
-                id=page_id,
-                label=label,
-                order=order,
-                file_ids=file_ids
-            ))
-
-        return pages
+        return [_parse_page(div) for div in _XP_PAGE_DIV(phys_struct)]
 
 
 class MODSExtractor:
@@ -286,10 +374,10 @@ class MODSExtractor:
             Title string or None if not found
         """
         try:
-            root = ET.fromstring(mets_xml)
-            mods = root.find('.//mods:mods', METS_NAMESPACES)
+            root = _unwrap_oai(_fromstring(mets_xml))
+            mods = _first(_XP_MODS, root)
             if mods is not None:
-                title_elem = mods.find('.//mods:titleInfo/mods:title', METS_NAMESPACES)
+                title_elem = _first(_XP_TITLE, mods)
                 if title_elem is not None and title_elem.text:
                     return title_elem.text.strip()
         except Exception:
@@ -307,13 +395,10 @@ class MODSExtractor:
             Author string or None if not found
         """
         try:
-            root = ET.fromstring(mets_xml)
-            mods = root.find('.//mods:mods', METS_NAMESPACES)
+            root = _unwrap_oai(_fromstring(mets_xml))
+            mods = _first(_XP_MODS, root)
             if mods is not None:
-                author_elem = mods.find(
-                    './/mods:name[@type="personal"]/mods:namePart',
-                    METS_NAMESPACES
-                )
+                author_elem = _first(_XP_AUTHOR, mods)
                 if author_elem is not None and author_elem.text:
                     return author_elem.text.strip()
         except Exception:
@@ -331,13 +416,10 @@ class MODSExtractor:
             Date string or None if not found
         """
         try:
-            root = ET.fromstring(mets_xml)
-            mods = root.find('.//mods:mods', METS_NAMESPACES)
+            root = _unwrap_oai(_fromstring(mets_xml))
+            mods = _first(_XP_MODS, root)
             if mods is not None:
-                date_elem = mods.find(
-                    './/mods:originInfo/mods:dateIssued',
-                    METS_NAMESPACES
-                )
+                date_elem = _first(_XP_DATE, mods)
                 if date_elem is not None and date_elem.text:
                     return date_elem.text.strip()
         except Exception:
@@ -362,3 +444,132 @@ def parse_mets_xml(xml_content: str) -> METSDocument:
     """
     parser = METSParser()
     return parser.parse(xml_content)
+
+
+def _iterparse(xml_content: Union[bytes, str], events: tuple) -> Any:
+    """Start incremental parsing of an XML document.
+
+    Args:
+        xml_content: Raw XML content (bytes preferred)
+        events: iterparse events to report
+
+    Returns:
+        Iterator of (event, element) pairs
+    """
+    if LXML_AVAILABLE:
+        tags = (_MODS_TAG, _FILE_GRP_TAG, _FILE_TAG, _STRUCT_MAP_TAG, _DIV_TAG)
+        if isinstance(xml_content, str):
+            return ET.iterparse(
+                io.BytesIO(xml_content.encode('utf-8')),
+                events=events, tag=tags, encoding='utf-8', **_PARSER_OPTIONS
+            )
+        return ET.iterparse(
+            io.BytesIO(xml_content), events=events, tag=tags, **_PARSER_OPTIONS
+        )
+
+    if isinstance(xml_content, str):
+        return ET.iterparse(io.StringIO(xml_content), events=events)
+    return ET.iterparse(io.BytesIO(xml_content), events=events)
+
+
+def _release(elem: Any) -> None:
+    """Free a fully processed element (and, with lxml, earlier siblings)."""
+    elem.clear()
+    if LXML_AVAILABLE:
+        parent = elem.getparent()
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
+def parse_mets_xml_streaming(xml_content: Union[bytes, str]) -> METSDocument:
+    """Parse METS XML incrementally into a METSDocument.
+
+    Gives the same result as parse_mets_xml, but builds files and pages
+    while the document is read and clears each processed element, so large
+    fileSec/structMap sections are never held in memory as a full tree.
+
+    Args:
+        xml_content: Raw XML content (bytes avoid a re-encode)
+
+    Returns:
+        Parsed METSDocument with metadata, pages, and files
+
+    Raises:
+        ValueError: If XML is malformed or not valid METS
+    """
+    metadata = None
+    files = {}
+    pages = []
+    uses = []  # USE attributes of the enclosing fileGrp elements
+    in_physical = False
+    seen_physical = False
+
+    try:
+        for event, elem in _iterparse(xml_content, ('start', 'end')):
+            tag = elem.tag
+
+            if event == 'start':
+                if tag == _FILE_GRP_TAG:
+                    uses.append(elem.get('USE'))
+                elif tag == _STRUCT_MAP_TAG:
+                    # Only the first physical structMap, like parse_mets_xml
+                    in_physical = not seen_physical and elem.get('TYPE') == 'PHYSICAL'
+                continue
+
+            if tag == _FILE_TAG:
+                mets_file = _parse_file(elem, uses[-1] if uses else None)
+                if mets_file is not None:
+                    files[mets_file.id] = mets_file
+            elif tag == _DIV_TAG:
+                if not in_physical:
+                    continue
+                if elem.get('TYPE') == 'page':
+                    pages.append(_parse_page(elem))
+            elif tag == _FILE_GRP_TAG:
+                uses.pop()
+            elif tag == _STRUCT_MAP_TAG:
+                seen_physical = seen_physical or in_physical
+                in_physical = False
+            elif tag == _MODS_TAG:
+                if metadata is None:
+                    metadata = _parse_mods(elem)
+            else:
+                continue
+
+            _release(elem)
+
+        return METSDocument(
+            metadata=metadata or METSMetadata(),
+            pages=pages,
+            files=files
+        )
+    except ET.ParseError as e:
+        raise ValueError(f"Invalid XML: {e}") from e
+    except Exception as e:
+        raise ValueError(f"Failed to parse METS: {e}") from e
+
+
+def parse_mets_xml_batch(
+    documents: Sequence[Union[bytes, str]],
+    max_workers: Optional[int] = None,
+) -> List[METSDocument]:
+    """Parse several METS documents in parallel worker processes.
+
+    Parsing is CPU-bound and holds the GIL, so independent documents are
+    spread across a process pool. A single document is parsed in-process.
+
+    Args:
+        documents: Raw XML contents, one per METS document
+        max_workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        Parsed METSDocuments in the same order as the input
+
+    Raises:
+        ValueError: If any document is malformed or not valid METS
+    """
+    if len(documents) <= 1:
+        return [parse_mets_xml(doc) for doc in documents]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(parse_mets_xml, documents, chunksize=4))
@@ -9,16 +9,22 @@ packaging research data with their metadata.
 """
 
 import json
+import os
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional
-
-from rocrate.model.contextentity import ContextEntity
-from rocrate.model.person import Person
-from rocrate.rocrate import ROCrate
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
 
 from pybookget.formats.base import MetadataWriter
 from pybookget.models.library import LibraryBook
 
+# RO-Crate version emitted by both write() and write_streaming()
+RO_CRATE_VERSION = "1.2"
+RO_CRATE_CONTEXT = f"https://w3id.org/ro/crate/{RO_CRATE_VERSION}/context"
+RO_CRATE_METADATA_FILE = "ro-crate-metadata.json"
+
+if TYPE_CHECKING:
+    from rocrate.rocrate import ROCrate
+
 
 class ROCrateWriter(MetadataWriter[LibraryBook]):
     """Writer for RO-Crate metadata files.
@@ -77,6 +83,73 @@ class ROCrateWriter(MetadataWriter[LibraryBook]):
         # Write to file
         crate.metadata.write(output_path)
 
+    def write_streaming(
+        self,
+        data: LibraryBook,
+        output_path: Path,
+        images_dir: Optional[Path] = None,
+        ocr_dir: Optional[Path] = None,
+        **options
+    ) -> None:
+        """Write LibraryBook as RO-Crate metadata without building the full document.
+
+        Produces the same entities as write(), but serializes them one by one
+        straight to the file instead of going through rocrate-py's in-memory
+        JSON-LD graph. The hasPart list, which has one entry per downloaded
+        file, is emitted entry by entry.
+
+        Args:
+            data: LibraryBook object to serialize
+            output_path: Directory where ro-crate-metadata.json should be written
+            images_dir: Optional path to images directory (for hasPart)
+            ocr_dir: Optional path to OCR directory (for hasPart)
+            **options: Additional options (unused)
+
+        Raises:
+            IOError: If file cannot be written
+        """
+        output_path = Path(output_path)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        root, entities = self._build_entities(data)
+        parts = (
+            self._iter_file_parts(output_path, images_dir, ocr_dir)
+            if self.include_files else iter(())
+        )
+        first_part = next(parts, None)
+
+        # Write to a temporary file and rename it into place, so an existing
+        # crate is only ever replaced by a complete one
+        metadata_path = output_path / RO_CRATE_METADATA_FILE
+        tmp_path = metadata_path.with_name(metadata_path.name + ".tmp")
+
+        dumps = json.dumps
+        with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            write = f.write
+            write(f'{{"@context": {dumps(RO_CRATE_CONTEXT)},\n"@graph": [\n')
+
+            # Root dataset, with hasPart appended as its last property and
+            # written one entry at a time as the directories are scanned
+            root_json = dumps(root, ensure_ascii=False)
+            if first_part is not None:
+                write(root_json[:-1])
+                write(', "hasPart": [\n')
+                write(dumps({"@id": first_part}, ensure_ascii=False))
+                for part in parts:
+                    write(",\n")
+                    write(dumps({"@id": part}, ensure_ascii=False))
+                write("\n]}")
+            else:
+                write(root_json)
+
+            for entity in entities:
+                write(",\n")
+                write(dumps(entity, ensure_ascii=False))
+
+            write("\n]}\n")
+
+        os.replace(tmp_path, metadata_path)
+
     def to_string(self, data: LibraryBook, **options) -> str:
         """Serialize LibraryBook to RO-Crate JSON string.
 
@@ -137,9 +210,12 @@ class ROCrateWriter(MetadataWriter[LibraryBook]):
         base_path: Optional[Path],
         images_dir: Optional[Path],
         ocr_dir: Optional[Path]
-    ) -> ROCrate:
+    ) -> "ROCrate":
         """Create ROCrate object from LibraryBook.
 
+        rocrate-py is imported here rather than at module level: importing it
+        is slow, and the streaming writer used by the handlers doesn't need it.
+
         Args:
             data: LibraryBook to convert
             base_path: Base path for resolving relative file paths
@@ -149,7 +225,12 @@ class ROCrateWriter(MetadataWriter[LibraryBook]):
         Returns:
             ROCrate object
         """
-        crate = ROCrate()
+        from rocrate.model.contextentity import ContextEntity
+        from rocrate.model.person import Person
+        from rocrate.rocrate import ROCrate
+
+        # Pin the spec version so write() matches write_streaming()
+        crate = ROCrate(version=RO_CRATE_VERSION)
         root = crate.root_dataset
         metadata = data.metadata
 
@@ -227,6 +308,74 @@ class ROCrateWriter(MetadataWriter[LibraryBook]):
 
         return crate
 
+    def _build_entities(self, data: LibraryBook) -> Tuple[dict, List[dict]]:
+        """Build the RO-Crate entities for a LibraryBook as plain dictionaries.
+
+        Mirrors _create_crate() without rocrate-py objects and without the
+        hasPart relationships.
+
+        Args:
+            data: LibraryBook to convert
+
+        Returns:
+            Tuple of (root dataset, other entities: metadata descriptor,
+            then creator, contributor and publisher when present)
+        """
+        metadata = data.metadata
+        mappings = DublinCoreMapper.MAPPINGS
+
+        root = {
+            "@id": "./",
+            "@type": "Dataset",
+            "name": metadata.title,  # dc:title
+            "datePublished": metadata.date,  # dc:date
+        }
+
+        # Context entities keyed by @id (a repeated @id replaces the earlier entity)
+        context_entities = {}
+
+        creator_id = f"#{metadata.creator.replace(' ', '_')}"
+        context_entities[creator_id] = {
+            "@id": creator_id, "@type": "Person", "name": metadata.creator,
+        }
+        root["creator"] = {"@id": creator_id}
+
+        if metadata.contributor:
+            contributor_id = f"#{metadata.contributor.replace(' ', '_')}_contributor"
+            context_entities[contributor_id] = {
+                "@id": contributor_id, "@type": "Person", "name": metadata.contributor,
+            }
+            root["contributor"] = {"@id": contributor_id}
+
+        if metadata.publisher:
+            publisher_id = f"#{metadata.publisher.replace(' ', '_')}"
+            context_entities[publisher_id] = {
+                "@id": publisher_id, "@type": "Organization", "name": metadata.publisher,
+            }
+            root["publisher"] = {"@id": publisher_id}
+
+        # Remaining optional Dublin Core fields map directly to Schema.org properties
+        for dc_property in (
+            "type", "format", "identifier", "source", "language",
+            "relation", "coverage", "rights", "description", "subject",
+        ):
+            value = getattr(metadata, dc_property)
+            if value:
+                root[mappings[dc_property]] = value
+
+        # Add book-specific metadata
+        root["numberOfPages"] = data.total_pages
+        root["bookId"] = data.book_id
+
+        descriptor = {
+            "@id": RO_CRATE_METADATA_FILE,
+            "@type": "CreativeWork",
+            "about": {"@id": "./"},
+            "conformsTo": {"@id": f"https://w3id.org/ro/crate/{RO_CRATE_VERSION}"},
+        }
+
+        return root, [descriptor, *context_entities.values()]
+
     def _collect_file_parts(
         self,
         base_path: Path,
@@ -243,23 +392,80 @@ class ROCrateWriter(MetadataWriter[LibraryBook]):
         Returns:
             List of relative file paths
         """
-        parts = []
-
-        # Add image files
-        if images_dir and images_dir.exists():
-            for img_file in sorted(images_dir.glob("*")):
-                if img_file.is_file():
-                    rel_path = img_file.relative_to(base_path)
-                    parts.append(str(rel_path))
-
-        # Add OCR files
-        if ocr_dir and ocr_dir.exists():
-            for ocr_file in sorted(ocr_dir.rglob("*")):
-                if ocr_file.is_file():
-                    rel_path = ocr_file.relative_to(base_path)
-                    parts.append(str(rel_path))
-
-        return parts
+        return list(self._iter_file_parts(base_path, images_dir, ocr_dir))
+
+    def _iter_file_parts(
+        self,
+        base_path: Path,
+        images_dir: Optional[Path],
+        ocr_dir: Optional[Path]
+    ) -> Iterator[str]:
+        """Yield file paths for hasPart relationships.
+
+        Args:
+            base_path: Base directory for relative path calculation
+            images_dir: Images directory path
+            ocr_dir: OCR directory path
+
+        Yields:
+            Relative file paths (images first, then OCR files)
+        """
+        base = os.fspath(base_path)
+
+        # Image files (top level only) and OCR files (recursive)
+        if images_dir:
+            yield from _iter_files(images_dir, base, recursive=False)
+        if ocr_dir:
+            yield from _iter_files(ocr_dir, base, recursive=True)
+
+
+# Sort key for os.DirEntry objects
+_entry_name = attrgetter("name")
+
+# Suffix of in-progress downloads (see pybookget.http.client.download_file);
+# leftovers from an interrupted run are not part of the crate
+_PARTIAL_SUFFIX = ".part"
+
+
+def _iter_files(root: Path, base: str, recursive: bool) -> Iterator[str]:
+    """Yield files under a directory as sorted paths relative to base.
+
+    Uses os.scandir so each entry's type comes from the directory listing
+    instead of a separate stat call per file. Entries are sorted by name
+    per directory, so paths come out in the same order as sorting them by
+    path components, without collecting the whole tree first.
+
+    Args:
+        root: Directory to scan (missing directories yield no files)
+        base: Base directory for relative path calculation
+        recursive: Whether to descend into subdirectories
+
+    Yields:
+        Relative file paths, using "/" as separator (partial downloads
+        ending in ".part" are skipped)
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=_entry_name)
+    except FileNotFoundError:
+        return
+
+    # Scanned paths start with the base directory whenever root lies inside
+    # it, so strip that prefix directly; relpath only for anything else
+    prefix = os.path.join(base, "")
+    prefix_len = len(prefix)
+    # hasPart @ids are URI paths, which always use "/"
+    sep = os.sep if os.sep != "/" else None
+
+    for entry in entries:
+        if entry.is_file():
+            if entry.name.endswith(_PARTIAL_SUFFIX):
+                continue
+            path = entry.path
+            path = path[prefix_len:] if path.startswith(prefix) else os.path.relpath(path, base)
+            yield path.replace(sep, "/") if sep else path
+        elif recursive and entry.is_dir():
+            yield from _iter_files(entry.path, base, recursive)
 
 
 class DublinCoreMapper:
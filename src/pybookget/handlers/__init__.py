@@ -8,8 +8,18 @@ Available handlers:
 - erara: e-rara.ch handler with IIIF, METS metadata, and OCR support
 """
 
-# Import handlers to trigger their registration
-# This ensures handlers are registered when the module is imported
-from pybookget.handlers import erara, iiif
+import importlib
 
 __all__ = ["iiif", "erara"]
+
+
+def __getattr__(name: str):
+    """Import handler modules on first attribute access.
+
+    Handlers register themselves when their module is imported. The
+    registry imports them on demand through the "pybookget.handlers"
+    entry points, so importing this package stays cheap.
+    """
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
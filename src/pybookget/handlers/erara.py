@@ -8,7 +8,7 @@ This handler extends the LibraryHandler to support e-rara.ch's features:
 - Plain text OCR files
 """
 
-import json
+import asyncio
 import logging
 import re
 from typing import Optional
@@ -18,13 +18,11 @@ from pybookget.formats.iiif import IIIFParser
 from pybookget.formats.mets import METSParser
 from pybookget.handlers.iiif import IIIFHandler
 from pybookget.handlers.library import LibraryHandler
-from pybookget.models.erara import (
-    ERaraBook,
-    add_iiif_urls_to_book,
-    create_erara_book_from_mets,
-)
+from pybookget.models.erara import add_iiif_urls_to_book, create_erara_book_from_mets
 from pybookget.models.library import LibraryBook
 from pybookget.router.registry import register_handler
+from pybookget.utils.fastjson import loads as json_loads
+from pybookget.utils.file import write_bytes_if_changed, write_json
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +50,7 @@ class ERaraHandler(LibraryHandler):
         """
         super().__init__(url, config)
         self.iiif_helper = IIIFHandler(url, config)
+        self._manifest_bytes: Optional[bytes] = None
 
     async def fetch_and_save_metadata(self) -> LibraryBook:
         """Fetch and save e-rara metadata (IIIF + METS).
@@ -117,17 +116,22 @@ class ERaraHandler(LibraryHandler):
         metadata_dir = self.get_metadata_dir()
 
         try:
-            # Save IIIF manifest (library-specific format)
+            # Save IIIF manifest (library-specific format), verbatim when the
+            # raw response body is available.
+            # Unchanged files are left alone so resumed runs don't rewrite them
             manifest_path = metadata_dir / "manifest.json"
-            with open(manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(iiif_data, f, indent=2, ensure_ascii=False)
-            logger.info(f"Saved IIIF manifest to {manifest_path}")
+            manifest_content = self._manifest_bytes
+            if manifest_content is not None:
+                written = write_bytes_if_changed(manifest_path, manifest_content)
+            else:
+                written = write_json(manifest_path, iiif_data)
+            if written:
+                logger.info(f"Saved IIIF manifest to {manifest_path}")
 
             # Save METS (library-specific format)
             mets_path = metadata_dir / "mets.xml"
-            with open(mets_path, 'w', encoding='utf-8') as f:
-                f.write(mets_data)
-            logger.info(f"Saved METS to {mets_path}")
+            if write_bytes_if_changed(mets_path, mets_data.encode('utf-8')):
+                logger.info(f"Saved METS to {mets_path}")
 
         except Exception as e:
             logger.error(f"Failed to save library metadata files: {e}")
@@ -187,6 +191,8 @@ class ERaraHandler(LibraryHandler):
     async def _fetch_metadata(self, iiif_url: str, mets_url: str) -> tuple[dict, str]:
         """Fetch IIIF manifest and METS metadata.
 
+        Both documents are independent, so they are requested concurrently.
+
         Args:
             iiif_url: IIIF manifest URL
             mets_url: METS OAI-PMH URL
@@ -199,15 +205,19 @@ class ERaraHandler(LibraryHandler):
         """
         client = self._ensure_client()
 
-        # Fetch IIIF manifest
         logger.debug(f"Fetching IIIF manifest: {iiif_url}")
-        iiif_response = await client.get(iiif_url)
+        logger.debug(f"Fetching METS metadata: {mets_url}")
+        iiif_response, mets_response = await asyncio.gather(
+            client.get(iiif_url),
+            client.get(mets_url),
+        )
+
+        # IIIF manifest
         iiif_response.raise_for_status()
-        iiif_data = iiif_response.json()
+        self._manifest_bytes = iiif_response.content
+        iiif_data = json_loads(self._manifest_bytes)
 
-        # Fetch METS
-        logger.debug(f"Fetching METS metadata: {mets_url}")
-        mets_response = await client.get(mets_url)
+        # METS
         mets_response.raise_for_status()
         mets_data = mets_response.text
 
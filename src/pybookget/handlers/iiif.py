@@ -3,7 +3,6 @@
 This handler supports any IIIF-compliant manifest (v2 or v3).
 """
 
-import json
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -13,10 +12,11 @@ from pybookget.formats.iiif import IIIFParser
 from pybookget.models.iiif import IIIFCanvas
 from pybookget.router.base import BaseHandler
 from pybookget.router.registry import register_handler
+from pybookget.utils.fastjson import loads as json_loads
+from pybookget.utils.file import write_bytes_if_changed, write_json
 
 logger = logging.getLogger(__name__)
 
-
 @register_handler("iiif")
 class IIIFHandler(BaseHandler):
     """Handler for IIIF manifests.
@@ -27,6 +27,17 @@ class IIIFHandler(BaseHandler):
     This is the default handler for pybookget.
     """
 
+    def __init__(self, url: str, config: Config):
+        """Initialize IIIF handler.
+
+        Args:
+            url: IIIF manifest URL
+            config: Configuration object
+        """
+        super().__init__(url, config)
+        # Raw manifest body as received, saved verbatim to metadata/manifest.json
+        self._manifest_bytes: Optional[bytes] = None
+
     async def run(self) -> Dict[str, any]:
         """Execute IIIF manifest download.
 
@@ -40,7 +51,11 @@ class IIIFHandler(BaseHandler):
             client = self._ensure_client()
             response = await client.get(self.url)
             response.raise_for_status()
-            manifest_data = response.json()
+
+            # Parse straight from the response bytes (no str decode) and keep
+            # them so the manifest can be saved without re-serializing
+            self._manifest_bytes = response.content
+            manifest_data = json_loads(self._manifest_bytes)
 
             # Parse IIIF manifest using format parser
             parser = IIIFParser()
@@ -105,6 +120,9 @@ class IIIFHandler(BaseHandler):
     async def _save_manifest(self, manifest_data: dict) -> None:
         """Save manifest.json to metadata directory.
 
+        The manifest is written exactly as served when the raw response body
+        is available, and pretty-printed from the parsed data otherwise.
+
         Args:
             manifest_data: Raw manifest data as dictionary
         """
@@ -112,10 +130,16 @@ class IIIFHandler(BaseHandler):
         manifest_path = metadata_dir / "manifest.json"
 
         try:
-            # Write manifest with pretty formatting
-            with open(manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(manifest_data, f, indent=2, ensure_ascii=False)
-            logger.info(f"Saved manifest to {manifest_path}")
+            # Skip rewriting unchanged files on resume
+            content = self._manifest_bytes
+            if content is not None:
+                written = write_bytes_if_changed(manifest_path, content)
+            else:
+                written = write_json(manifest_path, manifest_data)
+            if written:
+                logger.info(f"Saved manifest to {manifest_path}")
+            else:
+                logger.debug(f"Manifest unchanged, not rewriting {manifest_path}")
         except Exception as e:
             logger.error(f"Failed to save manifest: {e}")
 
@@ -177,7 +201,7 @@ class IIIFHandler(BaseHandler):
         """
         # If image has a service, use IIIF Image API
         if image.service:
-            service_id = image.service.id.rstrip('/')
+            service_id = image.service.id
 
             # Calculate optimal size parameter
             size_param = self._calculate_size_parameter(image)
@@ -211,26 +235,29 @@ class IIIFHandler(BaseHandler):
         if not service:
             return 2
 
-        # Check type field (v3 uses "ImageService3", "ImageService2")
-        if service.type:
-            if "ImageService3" in service.type or "ImageService3" == service.type:
+        # Fields are checked one at a time in priority order (type, context,
+        # profile); a field without a v2/v3 marker falls through to the next.
+        # Image API v1 is only recognized in the profile, where it maps to v2.
+        service_type = service.type
+        if service_type:
+            if "ImageService3" in service_type:
                 return 3
-            elif "ImageService2" in service.type or "ImageService2" == service.type:
+            if "ImageService2" in service_type:
                 return 2
 
-        # Check context field
-        if service.context:
-            if "/image/3/" in service.context or "image/3/context" in service.context:
+        context = service.context
+        if context:
+            if "/image/3/" in context or "image/3/context" in context:
                 return 3
-            elif "/image/2/" in service.context or "image/2/context" in service.context:
+            if "/image/2/" in context or "image/2/context" in context:
                 return 2
 
-        # Check profile field
-        if service.profile:
-            profile_str = service.profile if isinstance(service.profile, str) else str(service.profile)
+        profile = service.profile
+        if profile:
+            profile_str = profile if isinstance(profile, str) else str(profile)
             if "/image/3/" in profile_str:
                 return 3
-            elif "/image/2/" in profile_str or "/image/1/" in profile_str:
+            if "/image/2/" in profile_str or "/image/1/" in profile_str:
                 return 2
 
         # Default to v2 for backwards compatibility
@@ -286,23 +313,29 @@ class IIIFHandler(BaseHandler):
         if extension is None:
             extension = self.config.file_ext
 
+        # Local bindings for the loop
+        in_range = self.config.is_page_in_range
+        book_id = self.book_id or "unknown"
+        title = self.title
+        volume_id = self.volume_id or ""
+
         # Create download tasks with fallback URLs
         tasks = []
         for idx, (primary_url, fallback_url) in enumerate(image_url_pairs, start=start_index):
             # Apply page range filter if configured
-            if not self.config.is_page_in_range(idx):
+            if not in_range(idx):
                 continue
 
             # Generate filename with zero-padding
-            filename = f"{str(idx).zfill(4)}{extension}"
+            filename = f"{idx:04d}{extension}"
             save_path = save_dir / filename
 
             task = DownloadTask(
                 url=primary_url,
                 save_path=save_path,
-                book_id=self.book_id or "unknown",
-                title=self.title,
-                volume_id=self.volume_id or "",
+                book_id=book_id,
+                title=title,
+                volume_id=volume_id,
                 fallback_url=fallback_url,  # Add fallback URL
             )
             tasks.append(task)
@@ -311,8 +344,8 @@ class IIIFHandler(BaseHandler):
             logger.warning("No tasks to download (possibly filtered by page range)")
             return 0
 
-        # Execute downloads
-        dm = DownloadManager(self.config)
+        # Execute downloads over the handler's client so connections are reused
+        dm = DownloadManager(self.config, client=self._ensure_client())
         dm.add_tasks(tasks)
         successful = await dm.execute()
 
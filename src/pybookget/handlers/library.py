@@ -6,24 +6,30 @@ This module provides a base class for handlers that need to download:
 2. OCR files (optional, controlled by --skip-ocr flag)
 3. Images (optional, controlled by --skip-images flag)
 
-Subclasses should implement the abstract methods to provide library-specific logic.
+Subclasses should override fetch_and_save_metadata() to provide library-specific logic.
 Metadata follows Dublin Core standard and is serialized using RO-Crate v1.2.
 """
 
-import json
+import asyncio
 import logging
-from abc import abstractmethod
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
+
+import httpx
 
 from pybookget.config import Config
-from pybookget.formats.rocrate import ROCrateWriter
 from pybookget.http.download import DownloadManager, DownloadTask
-from pybookget.models.library import LibraryBook, LibraryPage
+from pybookget.models.library import LibraryBook
 from pybookget.router.base import BaseHandler
 
 logger = logging.getLogger(__name__)
 
+# DownloadTask.kind values used to split success counts per file type
+TASK_KIND_OCR = "ocr"
+TASK_KIND_IMAGE = "image"
+
 
 class LibraryHandler(BaseHandler):
     """Base handler for library-specific downloads.
@@ -33,17 +39,20 @@ class LibraryHandler(BaseHandler):
 
     Standard workflow:
     1. Fetch and save metadata (always done)
-    2. Download OCR files (skipped if config.skip_ocr is True)
-    3. Download images (skipped if config.skip_images is True)
-    4. Write RO-Crate metadata with hasPart relationships (automatic)
+    2. Download OCR files and images in one DownloadManager run
+       (OCR skipped if config.skip_ocr, images if config.skip_images)
+    3. Write RO-Crate metadata with hasPart relationships (automatic)
 
     Subclasses must implement:
     - fetch_and_save_metadata(): Fetch metadata and return LibraryBook
 
     Subclasses can override:
     - save_rocrate_metadata(): Customize RO-Crate metadata generation
-    - download_ocr(): Customize OCR download logic
-    - download_images_from_book(): Customize image download logic
+    - download_files(): Customize combined OCR and image download logic
+    - download_ocr(): Customize OCR-only download logic (when overridden,
+      download_files() delegates OCR to it instead of queuing OCR tasks)
+    - download_images_from_book(): Customize image-only download logic
+      (when overridden, download_files() delegates images to it)
     - get_ocr_tasks(): Customize OCR task creation
     - get_image_tasks(): Customize image task creation
     """
@@ -58,13 +67,18 @@ class LibraryHandler(BaseHandler):
         super().__init__(url, config)
         self.library_book: Optional[LibraryBook] = None
 
+        # Page orders passing the configured page range, computed once per book
+        self._allowed_orders: Optional[FrozenSet[int]] = None
+        self._allowed_orders_book: Optional[LibraryBook] = None
+        self._dirs_ready = False
+
     async def run(self) -> Dict[str, any]:
         """Execute library book download with standard workflow.
 
         Workflow:
         1. Fetch and save metadata (always)
-        2. Download OCR files (if not skipped)
-        3. Download images (if not skipped)
+        2. Download OCR files and images together (each unless skipped)
+        3. Write RO-Crate metadata
 
         Returns:
             Dictionary with download results including:
@@ -92,28 +106,30 @@ class LibraryHandler(BaseHandler):
             logger.info(f"Book: {self.title}")
             logger.info(f"Total pages: {self.library_book.total_pages}")
 
-            # Track download counts
-            images_downloaded = 0
-            ocr_files_downloaded = 0
+            # Create download directories once, before any tasks are built
+            self._ensure_dirs()
 
-            # Phase 2: Download OCR files (if not skipped)
-            if not self.config.skip_ocr:
-                logger.info("Phase 2: Downloading OCR files...")
-                ocr_files_downloaded = await self.download_ocr(self.library_book)
-                logger.info(f"Downloaded {ocr_files_downloaded} OCR files")
-            else:
-                logger.info("Phase 2: Skipping OCR downloads (--skip-ocr flag set)")
+            # Write the download-independent part of the RO-Crate (everything
+            # but hasPart) in the background, so the book directory holds valid
+            # crate metadata while downloads run
+            initial_crate = asyncio.ensure_future(
+                self.save_rocrate_metadata(include_files=False)
+            )
 
-            # Phase 3: Download images (if not skipped)
-            if not self.config.skip_images:
-                logger.info("Phase 3: Downloading images...")
-                images_downloaded = await self.download_images_from_book(self.library_book)
-                logger.info(f"Downloaded {images_downloaded} images")
-            else:
-                logger.info("Phase 3: Skipping image downloads (--skip-images flag set)")
+            # Phase 2: Download OCR files and images in a single pass
+            logger.info("Phase 2: Downloading OCR files and images...")
+            try:
+                ocr_files_downloaded, images_downloaded = await self.download_files(
+                    self.library_book
+                )
+            finally:
+                await initial_crate
+            logger.info(
+                f"Downloaded {ocr_files_downloaded} OCR files and {images_downloaded} images"
+            )
 
-            # Phase 4: Write RO-Crate metadata (after downloads complete)
-            logger.info("Phase 4: Writing RO-Crate metadata...")
+            # Phase 3: Write RO-Crate metadata (after downloads complete)
+            logger.info("Phase 3: Writing RO-Crate metadata...")
             await self.save_rocrate_metadata()
 
             logger.info(
@@ -131,7 +147,6 @@ class LibraryHandler(BaseHandler):
             logger.error(f"Failed to process library book: {e}", exc_info=True)
             return self._create_library_result(0, 0, 0, error=str(e))
 
-    @abstractmethod
     async def fetch_and_save_metadata(self) -> LibraryBook:
         """Fetch metadata and return a LibraryBook object.
 
@@ -148,21 +163,27 @@ class LibraryHandler(BaseHandler):
             LibraryBook object with metadata and pages populated
 
         Raises:
+            NotImplementedError: If the subclass does not override this method
             Exception if metadata cannot be fetched or parsed
         """
-        pass
+        raise NotImplementedError(
+            f"{type(self).__name__} must implement fetch_and_save_metadata()"
+        )
 
-    async def save_rocrate_metadata(self, **kwargs) -> None:
+    async def save_rocrate_metadata(self, include_files: bool = True, **kwargs) -> None:
         """Write RO-Crate metadata to the root directory.
 
         This method is called automatically after all downloads complete.
         It creates an RO-Crate metadata file following the Dublin Core standard,
         including hasPart relationships to all downloaded images and OCR files.
+        run() also calls it with include_files=False while downloads are in
+        progress, so a crate without hasPart exists from the start.
 
-        Uses the ROCrateWriter from the formats module for standardized
-        RO-Crate generation.
+        Uses the ROCrateWriter from the formats module, streaming the file so
+        memory use does not grow with the number of hasPart entries.
 
         Args:
+            include_files: Whether to include hasPart relationships for files
             **kwargs: Library-specific metadata to save
         """
         if not self.library_book:
@@ -170,30 +191,128 @@ class LibraryHandler(BaseHandler):
             return
 
         save_dir = self.get_save_dir()
-        images_dir = self.get_images_dir()
-        ocr_dir = self.get_ocr_dir()
 
         try:
-            # Use ROCrateWriter to generate RO-Crate metadata
-            writer = ROCrateWriter(include_files=True)
-            writer.write(
+            # Directory scan and JSON write are blocking, so run them in a
+            # worker thread to keep the event loop responsive
+            await asyncio.to_thread(
+                self._write_rocrate_sync,
                 self.library_book,
                 save_dir,
-                images_dir=images_dir,
-                ocr_dir=ocr_dir
+                self.get_images_dir(),
+                self.get_ocr_dir(),
+                include_files,
             )
-            logger.info(f"Saved RO-Crate metadata to {save_dir / 'ro-crate-metadata.json'}")
+            crate_path = save_dir / 'ro-crate-metadata.json'
+            if include_files:
+                logger.info(f"Saved RO-Crate metadata to {crate_path}")
+            else:
+                # Preliminary crate written during downloads; the final
+                # write after downloads reports the saved file
+                logger.debug(f"Saved preliminary RO-Crate metadata to {crate_path}")
 
         except Exception as e:
             logger.error(f"Failed to save RO-Crate metadata: {e}", exc_info=True)
 
+    def _write_rocrate_sync(
+        self,
+        book: LibraryBook,
+        save_dir: Path,
+        images_dir: Path,
+        ocr_dir: Path,
+        include_files: bool = True,
+    ) -> None:
+        """Write RO-Crate metadata synchronously (run in a worker thread).
+
+        Args:
+            book: LibraryBook to serialize
+            save_dir: Root directory receiving ro-crate-metadata.json
+            images_dir: Images directory (for hasPart)
+            ocr_dir: OCR directory (for hasPart)
+            include_files: Whether to include hasPart relationships for files
+        """
+        # Imported here so loading the handler doesn't pull in the writer
+        from pybookget.formats.rocrate import ROCrateWriter
+
+        writer = ROCrateWriter(include_files=include_files)
+        writer.write_streaming(book, save_dir, images_dir=images_dir, ocr_dir=ocr_dir)
+
+    async def download_files(self, book: LibraryBook) -> Tuple[int, int]:
+        """Download OCR files and images for the book in one pass.
+
+        OCR and image tasks are submitted to a single DownloadManager so
+        they share one connection pool and concurrency limit, instead of
+        the image downloads waiting for the slowest OCR file to finish.
+        Honors config.skip_ocr and config.skip_images, and probes OCR
+        availability like download_ocr().
+
+        If a subclass overrides download_ocr() or download_images_from_book(),
+        that file kind is downloaded through the override after the shared
+        run, so existing customizations keep working.
+
+        Args:
+            book: LibraryBook object with pages containing OCR and image URLs
+
+        Returns:
+            Tuple of (OCR files downloaded, images downloaded)
+        """
+        handler_type = type(self)
+        delegate_ocr = handler_type.download_ocr is not LibraryHandler.download_ocr
+        delegate_images = (
+            handler_type.download_images_from_book
+            is not LibraryHandler.download_images_from_book
+        )
+        tasks: list[DownloadTask] = []
+
+        if self.config.skip_ocr:
+            logger.info("Skipping OCR downloads (--skip-ocr flag set)")
+            delegate_ocr = False
+        elif not delegate_ocr:
+            if not self.config.force_ocr and not await self._probe_ocr_available(book):
+                logger.info("OCR not available for this book")
+            else:
+                ocr_tasks = await self.get_ocr_tasks(book)
+                logger.info(f"Queued {len(ocr_tasks)} OCR files")
+                tasks.extend(ocr_tasks)
+
+        if self.config.skip_images:
+            logger.info("Skipping image downloads (--skip-images flag set)")
+            delegate_images = False
+        elif not delegate_images:
+            image_tasks = await self.get_image_tasks(book)
+            logger.info(f"Queued {len(image_tasks)} images")
+            tasks.extend(image_tasks)
+
+        ocr_downloaded = images_downloaded = 0
+
+        if tasks:
+            # Execute downloads over the handler's client so connections are reused
+            dm = DownloadManager(self.config, client=self._ensure_client())
+            dm.add_tasks(tasks)
+            await dm.execute()
+
+            by_kind = dm.successful_by_kind
+            ocr_downloaded = by_kind.get(TASK_KIND_OCR, 0)
+            images_downloaded = by_kind.get(TASK_KIND_IMAGE, 0)
+        elif not (delegate_ocr or delegate_images):
+            logger.warning("No OCR or image tasks to download")
+            return 0, 0
+
+        if delegate_ocr:
+            ocr_downloaded = await self.download_ocr(book)
+        if delegate_images:
+            images_downloaded = await self.download_images_from_book(book)
+
+        return ocr_downloaded, images_downloaded
+
     async def download_ocr(self, book: LibraryBook) -> int:
         """Download OCR files for the book.
 
         Default implementation:
-        1. Gets OCR tasks from get_ocr_tasks()
-        2. Applies page range filtering
-        3. Downloads using DownloadManager
+        1. Probes one ALTO URL to check OCR is available (unless config.force_ocr)
+        2. Gets OCR tasks from get_ocr_tasks()
+        3. Applies page range filtering
+        4. Downloads using DownloadManager
 
         Args:
             book: LibraryBook object with pages containing OCR URLs
@@ -201,6 +320,10 @@ class LibraryHandler(BaseHandler):
         Returns:
             Number of successfully downloaded OCR files
         """
+        if not self.config.force_ocr and not await self._probe_ocr_available(book):
+            logger.info("OCR not available for this book")
+            return 0
+
         tasks = await self.get_ocr_tasks(book)
 
         if not tasks:
@@ -209,13 +332,40 @@ class LibraryHandler(BaseHandler):
 
         logger.info(f"Downloading {len(tasks)} OCR files...")
 
-        # Execute downloads
-        dm = DownloadManager(self.config)
+        # Execute downloads over the handler's client so connections are reused
+        dm = DownloadManager(self.config, client=self._ensure_client())
         dm.add_tasks(tasks)
         successful = await dm.execute()
 
         return successful
 
+    async def _probe_ocr_available(self, book: LibraryBook) -> bool:
+        """Check whether the library serves OCR for this book.
+
+        Libraries advertise ALTO URLs for every page even when no OCR was
+        produced, in which case every OCR request fails with 404. A single
+        HEAD request on the first ALTO URL avoids enqueuing those requests.
+
+        Args:
+            book: LibraryBook object with pages containing OCR URLs
+
+        Returns:
+            False if the probe returned 404, True otherwise (including when
+            the probe itself fails, so the regular download path decides)
+        """
+        alto_url = next((page.alto_url for page in book.pages if page.alto_url), None)
+        if not alto_url:
+            return True
+
+        client = self._ensure_client()
+        try:
+            response = await client.head(alto_url)
+        except httpx.HTTPError as e:
+            logger.debug(f"OCR probe failed for {alto_url}: {e}")
+            return True
+
+        return response.status_code != 404
+
     async def get_ocr_tasks(self, book: LibraryBook) -> list[DownloadTask]:
         """Create download tasks for OCR files.
 
@@ -234,44 +384,42 @@ class LibraryHandler(BaseHandler):
         alto_dir = ocr_dir / "alto"
         text_dir = ocr_dir / "text"
 
-        # Create subdirectories
-        alto_dir.mkdir(parents=True, exist_ok=True)
-        text_dir.mkdir(parents=True, exist_ok=True)
-
-        tasks = []
-
-        for page in book.pages:
-            # Apply page range filter
-            if not self.config.is_page_in_range(page.order):
-                continue
-
-            page_num_str = str(page.order).zfill(4)
-
-            # Add ALTO XML task
-            if page.alto_url:
-                alto_path = alto_dir / f"{page_num_str}.xml"
-                tasks.append(
-                    DownloadTask(
-                        url=page.alto_url,
-                        save_path=alto_path,
-                        book_id=self.book_id or "unknown",
-                        title=self.title,
-                    )
-                )
-
-            # Add plain text task
-            if page.plain_text_url:
-                text_path = text_dir / f"{page_num_str}.txt"
-                tasks.append(
-                    DownloadTask(
-                        url=page.plain_text_url,
-                        save_path=text_path,
-                        book_id=self.book_id or "unknown",
-                        title=self.title,
-                    )
+        # Local bindings for the comprehension
+        allowed = self._get_allowed_orders(book)
+        make_task = self._make_task_factory(TASK_KIND_OCR)
+        width = self._get_page_num_width(book)
+
+        pages = book.pages
+        has_alto = any(page.alto_url for page in pages)
+        has_text = any(page.plain_text_url for page in pages)
+
+        if has_alto and has_text:
+            # ALTO XML and plain text tasks per page (in that order), skipping missing URLs
+            return [
+                make_task(url=url, save_path=path)
+                for page in pages
+                if allowed is None or page.order in allowed
+                for url, path in (
+                    (page.alto_url, alto_dir / f"{page.order:0{width}d}.xml"),
+                    (page.plain_text_url, text_dir / f"{page.order:0{width}d}.txt"),
                 )
-
-        return tasks
+                if url
+            ]
+
+        # Most books carry only one OCR kind (or none): build just that kind,
+        # without computing paths for the absent one on every page
+        if has_alto:
+            get_url, target_dir, extension = attrgetter("alto_url"), alto_dir, ".xml"
+        elif has_text:
+            get_url, target_dir, extension = attrgetter("plain_text_url"), text_dir, ".txt"
+        else:
+            return []
+
+        return [
+            make_task(url=url, save_path=target_dir / f"{page.order:0{width}d}{extension}")
+            for page in pages
+            if (url := get_url(page)) and (allowed is None or page.order in allowed)
+        ]
 
     async def download_images_from_book(self, book: LibraryBook) -> int:
         """Download images for the book.
@@ -295,8 +443,8 @@ class LibraryHandler(BaseHandler):
 
         logger.info(f"Downloading {len(tasks)} images...")
 
-        # Execute downloads
-        dm = DownloadManager(self.config)
+        # Execute downloads over the handler's client so connections are reused
+        dm = DownloadManager(self.config, client=self._ensure_client())
         dm.add_tasks(tasks)
         successful = await dm.execute()
 
@@ -317,30 +465,102 @@ class LibraryHandler(BaseHandler):
             List of DownloadTask objects for images
         """
         images_dir = self.get_images_dir()
-        tasks = []
-
-        for page in book.pages:
-            # Apply page range filter
-            if not self.config.is_page_in_range(page.order):
-                continue
-
-            if not page.image_url:
-                continue
-
-            page_num_str = str(page.order).zfill(4)
-            image_path = images_dir / f"{page_num_str}{self.config.file_ext}"
-
-            tasks.append(
-                DownloadTask(
-                    url=page.image_url,
-                    save_path=image_path,
-                    fallback_url=page.image_fallback_url,
-                    book_id=self.book_id or "unknown",
-                    title=self.title,
-                )
+
+        # Local bindings for the comprehension
+        allowed = self._get_allowed_orders(book)
+        make_task = self._make_task_factory(TASK_KIND_IMAGE)
+        width = self._get_page_num_width(book)
+        file_ext = self.config.file_ext
+
+        return [
+            make_task(
+                url=page.image_url,
+                save_path=images_dir / f"{page.order:0{width}d}{file_ext}",
+                fallback_url=page.image_fallback_url,
             )
+            for page in book.pages
+            if page.image_url and (allowed is None or page.order in allowed)
+        ]
+
+    @staticmethod
+    def _get_page_num_width(book: LibraryBook) -> int:
+        """Get the zero-padding width for page numbers in file names.
+
+        At least 4 digits (matching existing downloads), widened for books
+        whose page orders go beyond 9999 so file names still sort correctly.
+
+        Args:
+            book: LibraryBook object with pages
+
+        Returns:
+            Number of digits to pad page numbers to
+        """
+        max_order = max((page.order for page in book.pages), default=0)
+        return max(4, len(str(max_order)))
+
+    def _make_task_factory(self, kind: str) -> Callable[..., DownloadTask]:
+        """Create a DownloadTask factory with the book-level fields bound.
+
+        The returned callable takes the per-file arguments (url, save_path and
+        optionally fallback_url or headers), so book_id, title and kind are
+        looked up once per task list rather than once per task.
+
+        Args:
+            kind: Task kind (TASK_KIND_OCR or TASK_KIND_IMAGE)
+
+        Returns:
+            Callable returning DownloadTask objects
+        """
+        return partial(
+            DownloadTask,
+            book_id=self.book_id or "unknown",
+            title=self.title,
+            kind=kind,
+        )
+
+    def _ensure_dirs(self) -> None:
+        """Create the download directories for this book once.
+
+        Creates the images/, metadata/ and ocr/ directories (via get_save_dir())
+        and, unless OCR is skipped, the ocr/alto/ and ocr/text/ subdirectories.
+        Later calls are no-ops. Downloads still create missing parent
+        directories themselves, so task builders do not depend on this.
+        """
+        if self._dirs_ready:
+            return
+
+        ocr_dir = self.get_ocr_dir()
+        if not self.config.skip_ocr:
+            (ocr_dir / "alto").mkdir(parents=True, exist_ok=True)
+            (ocr_dir / "text").mkdir(parents=True, exist_ok=True)
+
+        self._dirs_ready = True
+
+    def _get_allowed_orders(self, book: LibraryBook) -> Optional[FrozenSet[int]]:
+        """Get the page orders of the book that pass the configured page range.
+
+        Computed once per book so that building OCR and image tasks does a
+        set lookup per page instead of re-evaluating the range.
+
+        Args:
+            book: LibraryBook object with pages
+
+        Returns:
+            Frozenset of allowed page orders, or None if no page range is set
+            (all pages allowed)
+        """
+        if self._allowed_orders_book is not book:
+            config = self.config
+            if config.page_start is None or config.page_end is None:
+                self._allowed_orders = None
+            else:
+                in_range = config.is_page_in_range
+                self._allowed_orders = frozenset(
+                    page.order for page in book.pages if in_range(page.order)
+                )
+            self._allowed_orders_book = book
 
-        return tasks
+        return self._allowed_orders
 
     def _create_library_result(
         self,
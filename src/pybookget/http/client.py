@@ -8,21 +8,36 @@ Retry logic is handled by tenacity decorators for explicit and configurable
 retry behavior.
 """
 
+import asyncio
+import os
+import queue
 from pathlib import Path
 from typing import Dict, Optional
 
 import httpx
 from fake_useragent import UserAgent
 from tenacity import (
+    RetryCallState,
     retry,
+    retry_if_exception,
     stop_after_attempt,
     wait_exponential,
-    retry_if_exception_type,
 )
 
 from pybookget.config import Config
 from pybookget.http.cookies import load_cookies_from_file
 from pybookget.http.headers import load_headers_from_file
+from pybookget.http.ratelimit import HostRateLimiter
+
+# Size of the chunks streamed from response bodies to disk
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# HTTP statuses worth retrying: rate limiting and transient server errors.
+# Other error statuses (404, 403, ...) are permanent and fail immediately.
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Upper bound for honoring a server's Retry-After header (seconds)
+MAX_RETRY_AFTER = 60.0
 
 
 def create_client(config: Config) -> httpx.AsyncClient:
@@ -50,20 +65,21 @@ def create_client(config: Config) -> httpx.AsyncClient:
 
     headers = {'User-Agent': user_agent}
 
-    # Load additional headers from file
-    if config.header_file and Path(config.header_file).exists():
+    # Load additional headers from file (a missing file yields no headers)
+    if config.header_file:
         file_headers = load_headers_from_file(config.header_file)
         headers.update(file_headers)
 
     # Build cookies
     cookies = {}
-    if config.cookie_file and Path(config.cookie_file).exists():
+    if config.cookie_file:
         cookie_list = load_cookies_from_file(config.cookie_file)
         for cookie in cookie_list:
             cookies[cookie.name] = cookie.value
 
     # Create async client with configuration
-    # Disable connection pooling to ensure new connections for each request
+    # Keep-alive pooling is disabled by default (max_keepalive_connections=0)
+    # so each request opens a new connection
     return httpx.AsyncClient(
         headers=headers,
         cookies=cookies,
@@ -72,45 +88,125 @@ def create_client(config: Config) -> httpx.AsyncClient:
         follow_redirects=True,
         http2=True,
         proxy=config.proxy,
-        limits=httpx.Limits(max_keepalive_connections=0),
+        limits=httpx.Limits(max_keepalive_connections=config.max_keepalive_connections),
     )
 
 
+def is_rate_limited(exc: BaseException) -> bool:
+    """Check whether an exception is a rate-limit response from the server.
+
+    Args:
+        exc: Exception raised by a request
+
+    Returns:
+        True for HTTP 429, and for HTTP 503 carrying a Retry-After header
+    """
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return False
+
+    status = exc.response.status_code
+    return status == 429 or (status == 503 and "retry-after" in exc.response.headers)
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Check whether a failed request is worth retrying.
+
+    Args:
+        exc: Exception raised by a request
+
+    Returns:
+        True for transport errors (timeouts, connection failures) and for
+        rate-limit or transient server error statuses
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(exc, httpx.TransportError)
+
+
+def get_retry_after(exc: BaseException) -> Optional[float]:
+    """Get the delay requested by a rate-limit response's Retry-After header.
+
+    Only the delay-seconds form is supported; HTTP-date values are ignored.
+
+    Args:
+        exc: Exception raised by a request
+
+    Returns:
+        Delay in seconds (capped at MAX_RETRY_AFTER), or None if absent
+    """
+    if not is_rate_limited(exc):
+        return None
+
+    try:
+        delay = float(exc.response.headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
+
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
+
 def create_retry_decorator(config: Config):
     """Create a tenacity retry decorator from config.
 
+    Only retryable errors (see is_retryable_error) are retried, with
+    exponential backoff. Rate-limited responses wait at least as long as
+    their Retry-After header asks.
+
     Args:
         config: Configuration object
 
     Returns:
         Configured retry decorator
     """
+    backoff = wait_exponential(
+        multiplier=config.retry_multiplier,
+        min=config.retry_wait_min,
+        max=config.retry_wait_max,
+    )
+
+    def wait(retry_state: RetryCallState) -> float:
+        delay = backoff(retry_state)
+        retry_after = get_retry_after(retry_state.outcome.exception())
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
     return retry(
         stop=stop_after_attempt(config.max_retries),
-        wait=wait_exponential(
-            multiplier=config.retry_multiplier,
-            min=config.retry_wait_min,
-            max=config.retry_wait_max,
-        ),
-        retry=retry_if_exception_type((
-            httpx.HTTPError,
-            httpx.TimeoutException,
-            httpx.NetworkError,
-        )),
+        wait=wait,
+        retry=retry_if_exception(is_retryable_error),
         reraise=True,
     )
 
 
+def _write_chunks(path: Path, chunks: queue.SimpleQueue) -> None:
+    """Write queued chunks to a file until a None sentinel arrives.
+
+    Runs in a worker thread for the duration of one download attempt.
+
+    Args:
+        path: File to create (truncated if it exists)
+        chunks: Queue of bytes chunks, terminated by None
+    """
+    with open(path, "wb") as f:
+        while (chunk := chunks.get()) is not None:
+            f.write(chunk)
+
+
 async def download_file(
     client: httpx.AsyncClient,
     url: str,
     dest_path: Path,
     config: Config,
     headers: Optional[Dict[str, str]] = None,
+    rate_limiter: Optional[HostRateLimiter] = None,
 ) -> Path:
     """Download a file using httpx client with tenacity retry logic.
 
-    File is only written to disk after complete download.
+    The response body is streamed in chunks into a temporary ``.part`` file
+    next to the destination, which is renamed into place once complete, so
+    the destination only exists if fully downloaded and the body is never
+    held in memory as a whole.
     If file exists, it is skipped (file-level resumability).
 
     Retries are handled by tenacity with exponential backoff.
@@ -121,6 +217,7 @@ async def download_file(
         dest_path: Destination file path
         config: Config object for retry settings
         headers: Optional additional headers
+        rate_limiter: Optional per-host rate limiter, acquired before each attempt
 
     Returns:
         Path to downloaded file
@@ -134,6 +231,7 @@ async def download_file(
 
     # Ensure parent directory exists
     dest_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path = dest_path.with_name(dest_path.name + ".part")
 
     # Create retry decorator from config
     retry_decorator = create_retry_decorator(config)
@@ -141,16 +239,37 @@ async def download_file(
     # Define async download function with retry logic
     @retry_decorator
     async def _download_with_retry():
-        # Download entire file into memory first, then write to disk
-        # This ensures atomic writes - file only exists if fully downloaded
-        response = await client.get(url, headers=headers)
-        response.raise_for_status()
-        return response.content
+        if rate_limiter is not None:
+            await rate_limiter.acquire(url)
+
+        async with client.stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+
+            # Each attempt starts a fresh .part file. One worker thread opens,
+            # writes and closes it, fed through a queue, so the event loop
+            # never blocks on disk I/O and there is one thread hop per file
+            # rather than one per chunk.
+            chunks: queue.SimpleQueue = queue.SimpleQueue()
+            writer = asyncio.get_running_loop().run_in_executor(
+                None, _write_chunks, part_path, chunks
+            )
+            try:
+                async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    if writer.done():
+                        break  # Write failed; awaiting the writer raises its error
+                    chunks.put(chunk)
+            finally:
+                chunks.put(None)
+                await writer
 
     # Execute download with retries
-    content = await _download_with_retry()
+    try:
+        await _download_with_retry()
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
 
-    # Write complete file to disk atomically
-    dest_path.write_bytes(content)
+    # Move the complete file into place atomically
+    os.replace(part_path, dest_path)
 
     return dest_path
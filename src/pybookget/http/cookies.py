@@ -4,9 +4,21 @@ Supports Netscape cookie file format used by browsers and tools like curl.
 """
 
 from http.cookiejar import Cookie
-from pathlib import Path
 from typing import List
 
+# Cookie fields that are the same for every cookie in a Netscape cookie file
+_COOKIE_DEFAULTS = dict(
+    version=0,
+    port=None,
+    port_specified=False,
+    path_specified=True,
+    discard=False,
+    comment=None,
+    comment_url=None,
+    rest={},  # Copied by Cookie, so sharing the dict is safe
+    rfc2109=False,
+)
+
 
 def load_cookies_from_file(cookie_file: str) -> List[Cookie]:
     """Load cookies from Netscape cookie file format.
@@ -24,56 +36,46 @@ def load_cookies_from_file(cookie_file: str) -> List[Cookie]:
         # Netscape HTTP Cookie File
         .example.com    TRUE    /    FALSE    1735689600    sessionid    abc123
     """
+    # Open directly instead of checking exists() first; a 64 KiB buffer
+    # reads typical cookie jars in a single read() call
+    try:
+        with open(cookie_file, buffering=1 << 16) as f:
+            text = f.read()
+    except FileNotFoundError:
+        return []
+
+    # Split all non-empty, non-comment lines in one pass. The whole file is
+    # already read with one call and split in C; mmap with per-field bytes
+    # decoding measured slower than this for multi-MB jars
+    lines = text.splitlines()
+    rows = [line.split('\t', 7) for line in map(str.strip, lines) if line and line[0] != '#']
+
     cookies = []
-    cookie_path = Path(cookie_file)
-
-    if not cookie_path.exists():
-        return cookies
-
-    with open(cookie_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-
-            # Skip comments and empty lines
-            if not line or line.startswith('#'):
-                continue
-
-            # Parse cookie line
-            parts = line.split('\t')
-            if len(parts) < 7:
-                continue
-
-            domain, flag, path, secure, expiration, name, value = parts[:7]
-
-            # Convert string values to appropriate types
-            domain_specified = flag.upper() == 'TRUE'
-            secure_flag = secure.upper() == 'TRUE'
-
-            try:
-                expires = int(expiration)
-            except ValueError:
-                expires = None
-
-            # Create cookie object
-            cookie = Cookie(
-                version=0,
-                name=name,
-                value=value,
-                port=None,
-                port_specified=False,
-                domain=domain,
-                domain_specified=domain_specified,
-                domain_initial_dot=domain.startswith('.'),
-                path=path,
-                path_specified=True,
-                secure=secure_flag,
-                expires=expires,
-                discard=False,
-                comment=None,
-                comment_url=None,
-                rest={},
-                rfc2109=False,
-            )
-            cookies.append(cookie)
+    append = cookies.append
+
+    for parts in rows:
+        # Skip malformed lines (fewer than 7 tab-separated fields)
+        if len(parts) < 7:
+            continue
+
+        domain, flag, path, secure, expiration, name, value = parts[:7]
+
+        try:
+            expires = int(expiration)
+        except ValueError:
+            expires = None
+
+        # Create cookie object
+        append(Cookie(
+            name=name,
+            value=value,
+            domain=domain,
+            domain_specified=flag.upper() == 'TRUE',
+            domain_initial_dot=domain.startswith('.'),
+            path=path,
+            secure=secure.upper() == 'TRUE',
+            expires=expires,
+            **_COOKIE_DEFAULTS,
+        ))
 
     return cookies
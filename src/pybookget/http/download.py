@@ -1,27 +1,35 @@
 """Download manager with concurrent file-level downloads (async-only).
 
 File-level resumability: Files are skipped if they already exist.
-No below-file-level parallelization or chunking.
+Each file is fetched with a single request (no ranged or parallel parts);
+its body is streamed to disk in chunks through a temporary ``.part`` file
+that is renamed into place once complete (see http.client.download_file).
 """
 
 import asyncio
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 
 import httpx
 from tqdm import tqdm
 
+from pybookget._compat import DATACLASS_SLOTS
 from pybookget.config import Config
-from pybookget.http.client import create_client, download_file
+from pybookget.http.client import create_client, download_file, is_rate_limited
+from pybookget.http.ratelimit import HostRateLimiter
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DownloadTask:
-    """A single download task with URL and destination."""
+    """A single download task with URL and destination.
+
+    Uses __slots__ where supported, since books queue one task per page
+    and OCR file. Tasks therefore do not accept ad-hoc attributes.
+    """
 
     url: str
     save_path: Path
@@ -30,6 +38,7 @@ class DownloadTask:
     volume_id: str = ""
     headers: Optional[dict] = None
     fallback_url: Optional[str] = None  # Try this URL if primary fails with 404
+    kind: str = ""  # Task category (e.g. "image", "ocr") for per-kind success counts
 
     def __post_init__(self):
         """Ensure save_path is a Path object."""
@@ -43,9 +52,10 @@ class DownloadManager:
     Features:
     - File-level resumability (skip existing files)
     - Concurrent downloads (multiple files in parallel)
-    - No below-file-level parallelization
+    - One request per file (no ranged/parallel parts); bodies streamed to disk
     - Progress tracking with tqdm
-    - Async with asyncio.Semaphore for concurrency control
+    - Fixed pool of async workers for concurrency control
+    - Tasks can be consumed lazily from an iterable (see execute_iter())
     """
 
     def __init__(
@@ -53,6 +63,7 @@ class DownloadManager:
         config: Config,
         max_workers: Optional[int] = None,
         show_progress: bool = True,
+        client: Optional[httpx.AsyncClient] = None,
     ):
         """Initialize download manager.
 
@@ -60,11 +71,26 @@ class DownloadManager:
             config: Configuration object
             max_workers: Maximum number of concurrent downloads (defaults to config)
             show_progress: Whether to show progress bar
+            client: Optional shared httpx.AsyncClient. When given, it is used for
+                every execute() call and left open; otherwise a client is
+                created and closed per execute() call.
         """
         self.config = config
+        self.client = client
         self.max_workers = max_workers or config.threads_per_task
         self.show_progress = show_progress and config.show_progress
         self.tasks: List[DownloadTask] = []
+        self.successful_by_kind: Dict[str, int] = {}
+
+        # Failures from the last execute() call, and how many were rate limited
+        self.failed_count = 0
+        self.rate_limited_count = 0
+
+        # Per-host request rate limit shared by all downloads of this manager
+        self.rate_limiter: Optional[HostRateLimiter] = (
+            HostRateLimiter(config.requests_per_second)
+            if config.requests_per_second > 0 else None
+        )
 
     def add_task(self, task: DownloadTask):
         """Add a download task to the queue.
@@ -88,7 +114,8 @@ class DownloadManager:
     ) -> int:
         """Execute all queued download tasks concurrently.
 
-        Uses asyncio for concurrent downloads with Semaphore for concurrency control.
+        Runs the queued tasks through execute_iter() and clears the queue.
+        Successful downloads are also counted per task kind in successful_by_kind.
 
         Args:
             callback: Optional callback function called after each task completes
@@ -101,59 +128,91 @@ class DownloadManager:
             logger.warning("No tasks to execute")
             return 0
 
+        tasks, self.tasks = self.tasks, []
+        return await self.execute_iter(tasks, callback=callback, total=len(tasks))
+
+    async def execute_iter(
+        self,
+        tasks: Iterable[DownloadTask],
+        callback: Optional[Callable[[DownloadTask, bool], None]] = None,
+        total: Optional[int] = None,
+    ) -> int:
+        """Download tasks from an iterable with a fixed pool of workers.
+
+        max_workers workers pull tasks from the shared iterator, so no
+        coroutine is created per task up front and a generator is consumed
+        only as fast as downloads progress.
+        Successful downloads are also counted per task kind in successful_by_kind.
+
+        Args:
+            tasks: Iterable of DownloadTask objects
+            callback: Optional callback function called after each task completes
+                     with signature: callback(task, success)
+            total: Optional number of tasks, for the progress bar
+
+        Returns:
+            Number of successfully downloaded files
+        """
         successful = 0
         failed = 0
+        successful_by_kind: Dict[str, int] = {}
+        self.successful_by_kind = successful_by_kind
+        self.rate_limited_count = 0
 
-        # Create async httpx client
-        client = create_client(self.config)
+        # Workers take turns pulling from the shared iterator; next() runs
+        # between awaits, so no lock is needed
+        iterator = iter(tasks)
+
+        # Use the shared client if one was provided, else a private one
+        owns_client = self.client is None
+        client = create_client(self.config) if owns_client else self.client
 
         # Create progress bar if enabled
         pbar = None
         if self.show_progress:
-            pbar = tqdm(total=len(self.tasks), desc="Downloading", unit="file")
+            pbar = tqdm(total=total, desc="Downloading", unit="file")
 
-        try:
-            # Use asyncio.Semaphore to limit concurrent downloads
-            semaphore = asyncio.Semaphore(self.max_workers)
+        async def worker() -> None:
+            nonlocal successful, failed
 
-            async def download_with_semaphore(task: DownloadTask):
-                async with semaphore:
-                    return await self._download_single(client, task)
-
-            # Create all tasks
-            download_tasks = [download_with_semaphore(task) for task in self.tasks]
-
-            # Execute concurrently and process results
-            for task, coro in zip(self.tasks, asyncio.as_completed(download_tasks)):
+            while (task := next(iterator, None)) is not None:
                 try:
-                    success = await coro
-                    if success:
-                        successful += 1
-                    else:
-                        failed += 1
-
-                    # Call callback if provided
-                    if callback:
-                        callback(task, success)
-
+                    success = await self._download_single(client, task)
                 except Exception as e:
                     logger.error(f"Task failed with exception: {e}")
+                    success = False
+
+                if success:
+                    successful += 1
+                    successful_by_kind[task.kind] = successful_by_kind.get(task.kind, 0) + 1
+                else:
                     failed += 1
 
+                # Call callback if provided
+                if callback:
+                    callback(task, success)
+
                 # Update progress bar
                 if pbar:
                     pbar.update(1)
                     pbar.set_postfix({"success": successful, "failed": failed})
 
+        try:
+            await asyncio.gather(*(worker() for _ in range(max(1, self.max_workers))))
         finally:
-            await client.aclose()
+            if owns_client:
+                await client.aclose()
             if pbar:
                 pbar.close()
 
-        # Clear tasks after execution
-        self.tasks = []
+        self.failed_count = failed
 
         logger.info(f"Download complete: {successful} successful, {failed} failed")
+        if self.rate_limited_count:
+            logger.warning(
+                f"{self.rate_limited_count} downloads failed due to server rate limiting; "
+                f"consider lowering concurrency or setting a request rate limit"
+            )
         return successful
 
     async def _download_single(self, client: httpx.AsyncClient, task: DownloadTask) -> bool:
@@ -174,6 +233,7 @@ class DownloadManager:
                 dest_path=task.save_path,
                 config=self.config,
                 headers=task.headers,
+                rate_limiter=self.rate_limiter,
             )
 
             # Rate limiting if configured
@@ -194,6 +254,7 @@ class DownloadManager:
                         dest_path=task.save_path,
                         config=self.config,
                         headers=task.headers,
+                        rate_limiter=self.rate_limiter,
                     )
 
                     if self.config.sleep_interval > 0:
@@ -203,9 +264,13 @@ class DownloadManager:
                     return True
 
                 except Exception as fallback_error:
+                    if is_rate_limited(fallback_error):
+                        self.rate_limited_count += 1
                     logger.error(f"Fallback also failed for {task.fallback_url}: {fallback_error}")
                     return False
             else:
+                if is_rate_limited(e):
+                    self.rate_limited_count += 1
                 logger.error(f"Failed to download {task.url}: {e}")
                 return False
 
@@ -3,7 +3,6 @@
 Supports simple key-value header file format.
 """
 
-from pathlib import Path
 from typing import Dict
 
 
@@ -24,22 +23,24 @@ def load_headers_from_file(header_file: str) -> Dict[str, str]:
         X-Custom-Header: value
     """
     headers = {}
-    header_path = Path(header_file)
 
-    if not header_path.exists():
+    # Open directly instead of checking exists() first
+    try:
+        with open(header_file, buffering=1 << 16) as f:
+            text = f.read()
+    except FileNotFoundError:
         return headers
 
-    with open(header_path, 'r') as f:
-        for line in f:
-            line = line.strip()
+    for line in text.splitlines():
+        line = line.strip()
 
-            # Skip comments and empty lines
-            if not line or line.startswith('#'):
-                continue
+        # Skip comments and empty lines
+        if not line or line[0] == '#':
+            continue
 
-            # Parse header line
-            if ':' in line:
-                name, value = line.split(':', 1)
-                headers[name.strip()] = value.strip()
+        # Parse header line (lines without a colon are ignored)
+        name, sep, value = line.partition(':')
+        if sep:
+            headers[name.strip()] = value.strip()
 
     return headers
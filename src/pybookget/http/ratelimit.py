@@ -0,0 +1,84 @@
+"""Request rate limiting for downloads (async-only).
+
+Provides a token bucket per host so that concurrent downloads against the
+same library server stay under a configured requests-per-second rate,
+instead of bursting into HTTP 429 responses and stalling on retries.
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Token bucket allowing `rate` acquisitions per second on average.
+
+    Up to `capacity` tokens accumulate while idle, which allows short
+    bursts. Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second (must be positive)
+            capacity: Maximum stored tokens (defaults to max(1, rate))
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive: {rate}")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class HostRateLimiter:
+    """Per-host request rate limiter backed by one TokenBucket per host.
+
+    Example:
+        >>> limiter = HostRateLimiter(2.0)
+        >>> await limiter.acquire("https://www.e-rara.ch/i3f/v20/123/manifest")
+    """
+
+    def __init__(self, rate: float):
+        """Initialize rate limiter.
+
+        Args:
+            rate: Maximum requests per second per host (must be positive)
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive: {rate}")
+
+        self.rate = rate
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    async def acquire(self, url: str) -> None:
+        """Wait until a request to the URL's host is allowed.
+
+        Args:
+            url: URL about to be requested
+        """
+        host = urlsplit(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.rate)
+        await bucket.acquire()
@@ -7,14 +7,24 @@ IIIF, METS, and OCR data.
 These models extend the base library models with e-rara-specific fields.
 """
 
+import re
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 
+from pybookget._compat import DATACLASS_SLOTS
 from pybookget.models.library import LibraryBook, LibraryMetadata, LibraryPage
 from pybookget.models.mets import METSDocument
 
+# Placeholder for missing required Dublin Core fields, shared by all books
+_UNKNOWN = sys.intern("Unknown")
 
-@dataclass
+# Page ID fallback: find file IDs containing a digit, then keep only digits
+_DIGIT_RE = re.compile(r'\d')
+_NONDIGIT_RE = re.compile(r'\D+')
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ERaraMetadata(LibraryMetadata):
     """e-rara specific metadata extending base LibraryMetadata.
 
@@ -29,7 +39,7 @@ class ERaraMetadata(LibraryMetadata):
     extent: Optional[str] = None  # Physical description
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ERaraPage(LibraryPage):
     """e-rara page extending base LibraryPage.
 
@@ -39,7 +49,7 @@ class ERaraPage(LibraryPage):
     pass  # All functionality inherited from LibraryPage
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ERaraBook(LibraryBook):
     """e-rara book extending base LibraryBook.
 
@@ -47,7 +57,9 @@ class ERaraBook(LibraryBook):
         mets_document: Parsed METS document for advanced use cases
     """
     # Override to use ERaraMetadata type hint
-    metadata: ERaraMetadata = field(default_factory=lambda: ERaraMetadata(title="unknown"))
+    metadata: ERaraMetadata = field(
+        default_factory=lambda: ERaraMetadata(creator=_UNKNOWN, title=_UNKNOWN, date=_UNKNOWN)
+    )
 
     # Override to use ERaraPage type hint
     pages: list[ERaraPage] = field(default_factory=list)
@@ -109,9 +121,9 @@ def create_erara_book_from_mets(book_id: str, mets_doc: METSDocument) -> ERaraBo
     # Required fields: creator, title, date
     metadata = ERaraMetadata(
         # Required Dublin Core fields
-        creator=mets_metadata.author or "Unknown",  # dc:creator (required)
+        creator=mets_metadata.author or _UNKNOWN,  # dc:creator (required)
         title=mets_metadata.title or f"Book {book_id}",  # dc:title (required)
-        date=mets_metadata.date or "Unknown",  # dc:date (required)
+        date=mets_metadata.date or _UNKNOWN,  # dc:date (required)
 
         # Optional Dublin Core fields
         publisher=mets_metadata.publisher,  # dc:publisher
@@ -133,16 +145,14 @@ def create_erara_book_from_mets(book_id: str, mets_doc: METSDocument) -> ERaraBo
     )
 
     # Extract pages with ALTO URLs from METS
+    files = mets_doc.files
     for mets_page in mets_doc.pages:
-        # Extract numeric page ID from file references
-        page_id = _extract_page_id_from_mets_page(mets_page, mets_doc.files)
+        # Numeric page ID and ALTO URL from a single scan of the file references
+        page_id, alto_url = _resolve_alto(mets_page, files)
 
         if not page_id:
             continue
 
-        # Get ALTO URL if available
-        alto_url = _get_alto_url_for_page(mets_page, mets_doc.files)
-
         # Generate plain text URL from ALTO URL pattern
         plain_text_url = None
         if alto_url:
@@ -161,50 +171,41 @@ def create_erara_book_from_mets(book_id: str, mets_doc: METSDocument) -> ERaraBo
     return book
 
 
-def _extract_page_id_from_mets_page(mets_page, files: dict) -> Optional[str]:
+def _resolve_alto(mets_page, files: dict) -> tuple[Optional[str], Optional[str]]:
     """
-    Extract numeric page ID from METS page file references.
+    Extract numeric page ID and ALTO URL from METS page file references.
 
-    Args:
-        mets_page: METSPage object
-        files: Dictionary of file_id -> METSFile
-
-    Returns:
-        Numeric page ID string or None
-    """
-    # Try to extract from ALTO file ID (e.g., "ALTO24224396" -> "24224396")
-    for file_id in mets_page.file_ids:
-        if file_id.startswith('ALTO'):
-            return file_id.replace('ALTO', '')
-
-    # Fallback: try to extract from any file ID
-    for file_id in mets_page.file_ids:
-        # Extract numeric suffix
-        numeric_part = ''.join(c for c in file_id if c.isdigit())
-        if numeric_part:
-            return numeric_part
-
-    return None
-
-
-def _get_alto_url_for_page(mets_page, files: dict) -> Optional[str]:
-    """
-    Get ALTO URL for a METS page.
+    The page ID comes from the first ALTO file ID (e.g., "ALTO24224396" ->
+    "24224396") and the URL from the first ALTO file that has an href. If the
+    page has no ALTO files, the page ID falls back to the digits of the first
+    file ID containing any.
 
     Args:
         mets_page: METSPage object
         files: Dictionary of file_id -> METSFile
 
     Returns:
-        ALTO URL string or None
+        Tuple of (page ID or None, ALTO URL or None)
     """
+    page_id = None
+
     for file_id in mets_page.file_ids:
-        if file_id.startswith('ALTO'):
+        if file_id[:4] == 'ALTO':
+            if page_id is None:
+                page_id = file_id[4:]
             file_obj = files.get(file_id)
             if file_obj and file_obj.href:
-                return file_obj.href
+                return page_id, file_obj.href
+
+    if page_id is None:
+        # Fallback: digits of the first file ID that has any. The search
+        # stops at the first digit, so IDs without digits are never rebuilt
+        has_digit = _DIGIT_RE.search
+        for file_id in mets_page.file_ids:
+            if has_digit(file_id):
+                return _NONDIGIT_RE.sub('', file_id), None
 
-    return None
+    return page_id, None
 
 
 def add_iiif_urls_to_book(book: ERaraBook, iiif_image_urls: list[tuple[str, Optional[str]]]) -> None:
@@ -218,9 +219,7 @@ def add_iiif_urls_to_book(book: ERaraBook, iiif_image_urls: list[tuple[str, Opti
     Note:
         Modifies book.pages in place, setting image_url and image_fallback_url
     """
-    # Match IIIF URLs to pages by order/index
-    for i, page in enumerate(book.pages):
-        if i < len(iiif_image_urls):
-            primary_url, fallback_url = iiif_image_urls[i]
-            page.image_url = primary_url
-            page.image_fallback_url = fallback_url
+    # Match IIIF URLs to pages by order/index (zip stops at the shorter list)
+    for page, (primary_url, fallback_url) in zip(book.pages, iiif_image_urls):
+        page.image_url = primary_url
+        page.image_fallback_url = fallback_url
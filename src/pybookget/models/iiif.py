@@ -8,8 +8,11 @@ For parsing IIIF manifests, use pybookget.formats.iiif.IIIFParser.
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union
 
+from pybookget._compat import DATACLASS_SLOTS
+from pybookget.utils.fastjson import loads as json_loads
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class IIIFService:
     """IIIF Image Service information."""
 
@@ -18,18 +21,23 @@ class IIIFService:
     profile: Optional[str] = None
     context: Optional[str] = None
 
+    def __post_init__(self):
+        """Normalize service ID so Image API URLs can be appended directly."""
+        self.id = self.id.rstrip('/')
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "IIIFService":
         """Create IIIFService from dictionary."""
+        get = data.get
         return cls(
-            id=data.get('@id') or data.get('id', ''),
-            type=data.get('@type') or data.get('type'),
-            profile=data.get('profile'),
-            context=data.get('@context') or data.get('context'),
+            id=get('@id') or get('id', ''),
+            type=get('@type') or get('type'),
+            profile=get('profile'),
+            context=get('@context') or get('context'),
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class IIIFImage:
     """IIIF Image resource."""
 
@@ -43,26 +51,28 @@ class IIIFImage:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "IIIFImage":
         """Create IIIFImage from dictionary."""
+        get = data.get
+
         # Handle service - can be dict or list
-        service_data = data.get('service')
+        service_data = get('service')
         service = None
         if service_data:
-            if isinstance(service_data, list) and service_data:
+            if isinstance(service_data, list):
                 service = IIIFService.from_dict(service_data[0])
             elif isinstance(service_data, dict):
                 service = IIIFService.from_dict(service_data)
 
         return cls(
-            id=data.get('@id') or data.get('id', ''),
-            type=data.get('@type') or data.get('type'),
-            format=data.get('format'),
-            width=data.get('width'),
-            height=data.get('height'),
+            id=get('@id') or get('id', ''),
+            type=get('@type') or get('type'),
+            format=get('format'),
+            width=get('width'),
+            height=get('height'),
             service=service,
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class IIIFCanvas:
     """IIIF Canvas (page) information."""
 
@@ -75,41 +85,51 @@ class IIIFCanvas:
     @classmethod
     def from_dict_v2(cls, data: Dict[str, Any]) -> "IIIFCanvas":
         """Create IIIFCanvas from IIIF v2 dictionary."""
-        images = []
-        for img_data in data.get('images', []):
-            resource = img_data.get('resource', {})
-            if resource:
-                images.append(IIIFImage.from_dict(resource))
+        get = data.get
+        image_from_dict = IIIFImage.from_dict
+        images = [
+            image_from_dict(resource)
+            for img_data in get('images', ())
+            if (resource := img_data.get('resource'))
+        ]
 
         return cls(
-            id=data.get('@id', ''),
-            label=data.get('label', ''),
-            width=data.get('width'),
-            height=data.get('height'),
+            id=get('@id', ''),
+            label=get('label', ''),
+            width=get('width'),
+            height=get('height'),
             images=images,
         )
 
     @classmethod
     def from_dict_v3(cls, data: Dict[str, Any]) -> "IIIFCanvas":
         """Create IIIFCanvas from IIIF v3 dictionary."""
-        images = []
+        get = data.get
+        image_from_dict = IIIFImage.from_dict
         # V3 structure: canvas.items[].items[].body
-        for item in data.get('items', []):
-            for annotation in item.get('items', []):
-                body = annotation.get('body', {})
-                if body:
-                    images.append(IIIFImage.from_dict(body))
+        images = [
+            image_from_dict(body)
+            for item in get('items', ())
+            for annotation in item.get('items', ())
+            if (body := annotation.get('body'))
+        ]
+
+        # Language map ({"en": ["..."]}) or plain string
+        label = get('label', '')
+        if isinstance(label, dict):
+            en = label.get('en')
+            label = en[0] if en else ''
 
         return cls(
-            id=data.get('id', ''),
-            label=data.get('label', {}).get('en', [''])[0] if isinstance(data.get('label', {}), dict) else data.get('label', ''),
-            width=data.get('width'),
-            height=data.get('height'),
+            id=get('id', ''),
+            label=label,
+            width=get('width'),
+            height=get('height'),
             images=images,
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class IIIFManifestV2:
     """IIIF Presentation API v2 Manifest."""
 
@@ -122,10 +142,13 @@ class IIIFManifestV2:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "IIIFManifestV2":
         """Create IIIFManifestV2 from dictionary."""
-        canvases = []
-        for sequence in data.get('sequences', []):
-            for canvas_data in sequence.get('canvases', []):
-                canvases.append(IIIFCanvas.from_dict_v2(canvas_data))
+        # Bind the constructor locally; it runs once per canvas
+        from_dict_v2 = IIIFCanvas.from_dict_v2
+        canvases = [
+            from_dict_v2(canvas_data)
+            for sequence in data.get('sequences', [])
+            for canvas_data in sequence.get('canvases', [])
+        ]
 
         return cls(
             id=data.get('@id', ''),
@@ -135,8 +158,16 @@ class IIIFManifestV2:
             canvases=canvases,
         )
 
+    @classmethod
+    def from_bytes(cls, buf: bytes) -> "IIIFManifestV2":
+        """Create IIIFManifestV2 from a raw JSON document.
+
+        Parses with orjson when installed; bytes avoid a decode pass.
+        """
+        return cls.from_dict(json_loads(buf))
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class IIIFManifestV3:
     """IIIF Presentation API v3 Manifest."""
 
@@ -150,9 +181,9 @@ class IIIFManifestV3:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "IIIFManifestV3":
         """Create IIIFManifestV3 from dictionary."""
-        items = []
-        for canvas_data in data.get('items', []):
-            items.append(IIIFCanvas.from_dict_v3(canvas_data))
+        # Bind the constructor locally; it runs once per canvas
+        from_dict_v3 = IIIFCanvas.from_dict_v3
+        items = [from_dict_v3(canvas_data) for canvas_data in data.get('items', [])]
 
         return cls(
             id=data.get('id', ''),
@@ -163,6 +194,14 @@ class IIIFManifestV3:
             items=items,
         )
 
+    @classmethod
+    def from_bytes(cls, buf: bytes) -> "IIIFManifestV3":
+        """Create IIIFManifestV3 from a raw JSON document.
+
+        Parses with orjson when installed; bytes avoid a decode pass.
+        """
+        return cls.from_dict(json_loads(buf))
+
     @property
     def canvases(self) -> List[IIIFCanvas]:
         """Alias for items to match v2 API."""
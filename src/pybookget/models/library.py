@@ -8,11 +8,14 @@ library implementations (e-rara, Gallica, Internet Archive, etc.).
 Metadata follows Dublin Core standard with required fields: creator, title, date.
 """
 
+import math
 from dataclasses import dataclass, field
 from typing import Optional, List
 
+from pybookget._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class LibraryMetadata:
     """Base class for library book metadata following Dublin Core standard.
 
@@ -57,7 +60,7 @@ class LibraryMetadata:
     subject: Optional[List[str]] = None    # dc:subject
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LibraryPage:
     """Base class for a page/canvas in a library book.
 
@@ -85,7 +88,7 @@ class LibraryPage:
     plain_text_url: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LibraryBook:
     """Base class for a complete library book.
 
@@ -128,12 +131,9 @@ class LibraryBook:
         if start is None and end is None:
             return self.pages
 
-        filtered_pages = []
-        for page in self.pages:
-            if start is not None and page.order < start:
-                continue
-            if end is not None and page.order > end:
-                continue
-            filtered_pages.append(page)
-
-        return filtered_pages
+        # One pass with a single comparison chain per page; open ends are
+        # replaced by bounds every order satisfies, and pages need not be
+        # sorted by order
+        lo = start if start is not None else -math.inf
+        hi = end if end is not None else math.inf
+        return [page for page in self.pages if lo <= page.order <= hi]
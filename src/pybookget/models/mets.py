@@ -10,6 +10,8 @@ For parsing METS XML, use pybookget.formats.mets.METSParser.
 from dataclasses import dataclass, field
 from typing import Optional
 
+from pybookget._compat import DATACLASS_SLOTS
+
 
 # METS namespace mapping
 METS_NAMESPACES = {
@@ -20,7 +22,7 @@ METS_NAMESPACES = {
 }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class METSFile:
     """Represents a file reference in METS."""
     id: str
@@ -29,7 +31,7 @@ class METSFile:
     use: Optional[str] = None  # e.g., "FULLTEXT", "DEFAULT", "THUMBS"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class METSPage:
     """Represents a page in METS physical structure."""
     id: str
@@ -38,7 +40,7 @@ class METSPage:
     file_ids: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class METSMetadata:
     """MODS metadata extracted from METS."""
     title: Optional[str] = None
@@ -52,7 +54,7 @@ class METSMetadata:
     license: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class METSDocument:
     """Represents a parsed METS document."""
     metadata: METSMetadata
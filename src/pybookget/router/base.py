@@ -1,7 +1,6 @@
 """Base handler class for all site-specific handlers (async-only)."""
 
 import logging
-from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -15,7 +14,7 @@ from pybookget.utils.text import extract_id_from_url, get_domain, url_to_slug
 logger = logging.getLogger(__name__)
 
 
-class BaseHandler(ABC):
+class BaseHandler:
     """Base class for all site-specific download handlers (async-only).
 
     Each handler implements site-specific logic for:
@@ -45,6 +44,10 @@ class BaseHandler(ABC):
         self.book_id: Optional[str] = None
         self.title: str = "unknown"
         self.volume_id: Optional[str] = None
+        self._save_dir: Optional[Path] = None
+        self._images_dir: Optional[Path] = None
+        self._metadata_dir: Optional[Path] = None
+        self._ocr_dir: Optional[Path] = None
 
     def _ensure_client(self) -> httpx.AsyncClient:
         """Ensure httpx client is created (lazy initialization).
@@ -56,7 +59,6 @@ class BaseHandler(ABC):
             self.client = create_client(self.config)
         return self.client
 
-    @abstractmethod
     async def run(self) -> Dict[str, any]:
         """Execute the download process.
 
@@ -77,8 +79,11 @@ class BaseHandler(ABC):
                 "downloaded": number_downloaded,
                 "save_path": Path_to_downloads,
             }
+
+        Raises:
+            NotImplementedError: If the subclass does not override run()
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement run()")
 
     def get_book_id(self, pattern: Optional[str] = None) -> str:
         """Extract book ID from URL.
@@ -107,9 +112,16 @@ class BaseHandler(ABC):
         - metadata/: For library-specific metadata files (manifest.json, mets.xml, etc.)
         - ocr/: For OCR text files (alto/, text/ subdirectories)
 
+        The directory is computed and created on first call, then cached for
+        the lifetime of the handler (as are the subdirectory paths returned by
+        get_images_dir(), get_metadata_dir() and get_ocr_dir()).
+
         Returns:
             Path object for base save directory
         """
+        if self._save_dir is not None:
+            return self._save_dir
+
         domain = get_domain(self.url)
 
         # Create reversible slug from URL (base64url-encoded)
@@ -118,13 +130,21 @@ class BaseHandler(ABC):
         # Create directory structure: downloads/domain/slug/
         # Format: downloads/www.loc.gov/aHR0cHM6Ly93d3cubG9jLmdvdi9pdGVtL2x0ZjkwMDA3NTQ3L21hbmlmZXN0Lmpzb24/
         save_dir = Path(self.config.download_dir) / domain / url_slug
-        save_dir.mkdir(parents=True, exist_ok=True)
-
-        # Create subdirectories
-        (save_dir / "images").mkdir(exist_ok=True)
-        (save_dir / "metadata").mkdir(exist_ok=True)
-        (save_dir / "ocr").mkdir(exist_ok=True)
 
+        # Create only the leaf directories; parents=True on the first one
+        # creates save_dir and its ancestors, so no separate mkdir is needed.
+        # The same paths are cached for the getters.
+        images_dir = save_dir / "images"
+        metadata_dir = save_dir / "metadata"
+        ocr_dir = save_dir / "ocr"
+        images_dir.mkdir(parents=True, exist_ok=True)
+        metadata_dir.mkdir(exist_ok=True)
+        ocr_dir.mkdir(exist_ok=True)
+
+        self._images_dir = images_dir
+        self._metadata_dir = metadata_dir
+        self._ocr_dir = ocr_dir
+        self._save_dir = save_dir
         return save_dir
 
     def get_images_dir(self) -> Path:
@@ -133,7 +153,9 @@ class BaseHandler(ABC):
         Returns:
             Path object for images directory
         """
-        return self.get_save_dir() / "images"
+        if self._images_dir is None:
+            self.get_save_dir()
+        return self._images_dir
 
     def get_metadata_dir(self) -> Path:
         """Get the metadata subdirectory.
@@ -141,7 +163,9 @@ class BaseHandler(ABC):
         Returns:
             Path object for metadata directory
         """
-        return self.get_save_dir() / "metadata"
+        if self._metadata_dir is None:
+            self.get_save_dir()
+        return self._metadata_dir
 
     def get_ocr_dir(self) -> Path:
         """Get the OCR subdirectory.
@@ -149,7 +173,9 @@ class BaseHandler(ABC):
         Returns:
             Path object for OCR directory
         """
-        return self.get_save_dir() / "ocr"
+        if self._ocr_dir is None:
+            self.get_save_dir()
+        return self._ocr_dir
 
     def create_download_tasks(
         self,
@@ -175,22 +201,32 @@ class BaseHandler(ABC):
         if extension is None:
             extension = self.config.file_ext
 
+        # Apply page range filter if configured: indices are consecutive, so
+        # the range maps to one slice of the URL list
+        page_start = self.config.page_start
+        page_end = self.config.page_end
+        if page_start is not None and page_end is not None:
+            skip = max(0, page_start - start_index)
+            image_urls = image_urls[skip:max(0, page_end - start_index + 1)]
+            start_index += skip
+
+        # Local bindings for the loop
+        book_id = self.book_id or "unknown"
+        title = self.title
+        volume_id = self.volume_id or ""
+
         tasks = []
         for idx, url in enumerate(image_urls, start=start_index):
-            # Apply page range filter if configured
-            if not self.config.is_page_in_range(idx):
-                continue
-
             # Generate filename with zero-padding
-            filename = f"{str(idx).zfill(4)}{extension}"
+            filename = f"{idx:04d}{extension}"
             save_path = save_dir / filename
 
             task = DownloadTask(
                 url=url,
                 save_path=save_path,
-                book_id=self.book_id or "unknown",
-                title=self.title,
-                volume_id=self.volume_id or "",
+                book_id=book_id,
+                title=title,
+                volume_id=volume_id,
             )
             tasks.append(task)
 
@@ -228,8 +264,8 @@ class BaseHandler(ABC):
             logger.warning("No tasks to download (possibly filtered by page range)")
             return 0
 
-        # Execute downloads
-        dm = DownloadManager(self.config)
+        # Execute downloads over the handler's client so connections are reused
+        dm = DownloadManager(self.config, client=self._ensure_client())
         dm.add_tasks(tasks)
         successful = await dm.execute()
 
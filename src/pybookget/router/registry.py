@@ -1,6 +1,7 @@
 """Handler registry for manual handler selection."""
 
 import logging
+from importlib.metadata import EntryPoint, entry_points
 from typing import Dict, Optional, Type
 
 from pybookget.config import Config
@@ -8,14 +9,27 @@ from pybookget.router.base import BaseHandler
 
 logger = logging.getLogger(__name__)
 
+# Entry point group under which handler classes are published
+HANDLER_ENTRY_POINT_GROUP = "pybookget.handlers"
+
+# Built-in handlers, used when package metadata is unavailable
+# (e.g. running from a source checkout that was never installed)
+_BUILTIN_HANDLERS = {
+    "erara": "pybookget.handlers.erara:ERaraHandler",
+    "iiif": "pybookget.handlers.iiif:IIIFHandler",
+}
+
 
 class HandlerRegistry:
     """Registry for storing available handlers by name.
 
     Handlers must be explicitly selected by name - no automatic URL matching.
+    Handler names are discovered from the "pybookget.handlers" entry points;
+    a handler's module is only imported when that handler is requested.
     """
 
     _handlers: Dict[str, Type[BaseHandler]] = {}
+    _entry_points: Dict[str, EntryPoint] = {}
     _initialized: bool = False
 
     @classmethod
@@ -46,20 +60,48 @@ class HandlerRegistry:
         Returns:
             Handler instance or None if handler not found
         """
-        # Lazy initialization of handlers
-        if not cls._initialized:
-            cls._initialize_handlers()
-
+        # Handlers already imported (registered or loaded earlier) resolve
+        # with a single dict lookup; entry points are only consulted on a miss
         handler_class = cls._handlers.get(handler_name)
+        if handler_class is None:
+            if not cls._initialized:
+                cls._initialize_handlers()
+            handler_class = cls._load_handler(handler_name)
         if not handler_class:
-            logger.error(f"Handler '{handler_name}' not found. Available: {list(cls._handlers.keys())}")
+            logger.error(
+                f"Handler '{handler_name}' not found. "
+                f"Available: {cls.list_available_handlers()}"
+            )
             return None
 
         return handler_class(url, config)
 
+    @classmethod
+    def _load_handler(cls, name: str) -> Optional[Type[BaseHandler]]:
+        """Import a handler through its entry point and cache the class.
+
+        Args:
+            name: Handler name
+
+        Returns:
+            Handler class or None if unknown or not importable
+        """
+        entry_point = cls._entry_points.get(name)
+        if entry_point is None:
+            return None
+
+        try:
+            handler_class = entry_point.load()
+        except ImportError as e:
+            logger.warning(f"Failed to import handler '{name}': {e}")
+            return None
+
+        cls._handlers[name] = handler_class
+        return handler_class
+
     @classmethod
     def _initialize_handlers(cls):
-        """Initialize all handlers by importing handler modules.
+        """Discover handler entry points without importing handler modules.
 
         This is called lazily on first use to avoid circular imports.
         """
@@ -67,17 +109,23 @@ class HandlerRegistry:
             return
 
         try:
-            # Import all handler modules to trigger their registration
-            from pybookget.handlers import (
-                erara,
-                iiif,
-                # Additional site-specific handlers can be imported here
+            eps = entry_points()
+            if hasattr(eps, 'select'):
+                found = eps.select(group=HANDLER_ENTRY_POINT_GROUP)
+            else:  # Python < 3.10 returns a dict of groups
+                found = eps.get(HANDLER_ENTRY_POINT_GROUP, ())
+            for entry_point in found:
+                cls._entry_points.setdefault(entry_point.name, entry_point)
+        except Exception as e:
+            logger.warning(f"Failed to read handler entry points: {e}")
+
+        for name, value in _BUILTIN_HANDLERS.items():
+            cls._entry_points.setdefault(
+                name, EntryPoint(name, value, HANDLER_ENTRY_POINT_GROUP)
             )
-        except ImportError as e:
-            logger.warning(f"Failed to import some handlers: {e}")
 
         cls._initialized = True
-        logger.info(f"Initialized handler registry with {len(cls._handlers)} handlers")
+        logger.info(f"Initialized handler registry with {len(cls._entry_points)} handlers")
 
     @classmethod
     def list_available_handlers(cls) -> list[str]:
@@ -89,7 +137,7 @@ class HandlerRegistry:
         if not cls._initialized:
             cls._initialize_handlers()
 
-        return sorted(cls._handlers.keys())
+        return sorted(cls._handlers.keys() | cls._entry_points.keys())
 
 
 def register_handler(name: str):
@@ -0,0 +1,45 @@
+"""JSON helpers that use orjson when it is installed.
+
+orjson parses ``bytes`` directly, so HTTP response bodies can be handed to
+the parser without decoding them to ``str`` first, and serializes straight
+to UTF-8 ``bytes`` ready for writing. The standard library ``json`` module
+is used as a fallback and accepts bytes as well.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or str.
+
+    Args:
+        data: Raw JSON document (UTF-8 bytes or str)
+
+    Returns:
+        Parsed JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize a value as pretty-printed UTF-8 JSON.
+
+    Output is indented by two spaces with non-ASCII characters kept as-is.
+
+    Args:
+        obj: JSON-serializable value
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
@@ -1,9 +1,12 @@
 """File operation utilities."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 from urllib.parse import urlparse
 
+from pybookget.utils.fastjson import dumps as json_dumps
+from pybookget.utils.text import url_path
+
 
 def ensure_dir(path: Path) -> Path:
     """Ensure directory exists, creating it if necessary.
@@ -18,6 +21,45 @@ def ensure_dir(path: Path) -> Path:
     return path
 
 
+def write_bytes_if_changed(path: Path, data: bytes) -> bool:
+    """Write bytes to a file unless it already holds identical content.
+
+    Keeps resumed runs from rewriting unchanged metadata files. The size
+    check avoids reading the existing file when the content clearly differs.
+
+    Args:
+        path: Destination file path
+        data: Content to write
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    path.write_bytes(data)
+    return True
+
+
+def write_json(path: Path, obj: Any) -> bool:
+    """Write a value as pretty-printed JSON unless the file already matches.
+
+    Uses orjson when installed (see pybookget.utils.fastjson), which encodes
+    directly to bytes without an intermediate str.
+
+    Args:
+        path: Destination file path
+        obj: JSON-serializable value (e.g. a parsed IIIF manifest)
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    return write_bytes_if_changed(path, json_dumps(obj))
+
+
 def get_file_extension(url_or_path: str, default: str = ".jpg") -> str:
     """Extract file extension from URL or path.
 
@@ -28,6 +70,17 @@ def get_file_extension(url_or_path: str, default: str = ".jpg") -> str:
     Returns:
         File extension including the dot (e.g., '.jpg')
     """
+    # Fast path: read the suffix of the last path segment directly,
+    # following Path.suffix rules (no suffix for '.name' or 'name.')
+    path = url_path(url_or_path)
+    if path is not None:
+        name = path.rstrip('/').rpartition('/')[2]
+        if name != '.':
+            dot = name.rfind('.')
+            if 0 < dot < len(name) - 1:
+                return name[dot:].lower()
+            return default
+
     parsed = urlparse(url_or_path)
     path = Path(parsed.path)
 
@@ -54,5 +107,4 @@ def generate_filename(
     Returns:
         Formatted filename
     """
-    number = str(index).zfill(width)
-    return f"{prefix}{number}{extension}"
+    return f"{prefix}{index:0{width}d}{extension}"
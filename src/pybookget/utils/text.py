@@ -1,6 +1,7 @@
 """Text and URL parsing utilities."""
 
 import re
+from functools import lru_cache
 from typing import Optional, Tuple
 from urllib.parse import urlparse
 
@@ -8,6 +9,34 @@ import tldextract
 import url64
 
 
+# Scheme and netloc at the start of an absolute URL (as urlparse splits them)
+_HOST_URL_RE = re.compile(r'([A-Za-z][A-Za-z0-9+.\-]*)://([^/?#]*)')
+# Characters that urlparse treats specially (params, stripped control
+# characters, IPv6 brackets); URLs containing them take the slow path.
+_URLPARSE_SPECIAL_RE = re.compile(r'[;\t\r\n\[\]]')
+
+
+def url_path(url: str) -> Optional[str]:
+    """Return the path of a plain scheme://host URL without urlparse.
+
+    Args:
+        url: URL to slice
+
+    Returns:
+        Same value as urlparse(url).path, or None if the URL needs urlparse
+    """
+    match = _HOST_URL_RE.match(url)
+    if match is None or _URLPARSE_SPECIAL_RE.search(url):
+        return None
+    return url[match.end():].partition('#')[0].partition('?')[0]
+
+
+@lru_cache(maxsize=128)
+def _compile(pattern: str) -> re.Pattern:
+    """Compile a regex pattern once per distinct pattern string."""
+    return re.compile(pattern)
+
+
 def extract_between(text: str, start: str, end: str) -> Optional[str]:
     """Extract text between two markers.
 
@@ -27,6 +56,7 @@ def extract_between(text: str, start: str, end: str) -> Optional[str]:
         return None
 
 
+@lru_cache(maxsize=256)
 def get_domain(url: str) -> str:
     """Extract root-level domain from URL.
 
@@ -47,6 +77,8 @@ def get_domain(url: str) -> str:
         >>> get_domain('https://www.example.co.uk/page')
         'example.co.uk'
     """
+    # Cached: tldextract's suffix lookup is comparatively slow and handlers
+    # resolve the same URL more than once
     extracted = tldextract.extract(url)
     # Return registered domain (domain + suffix)
     # e.g., 'loc' + 'gov' = 'loc.gov'
@@ -62,6 +94,11 @@ def get_host_url(url: str) -> str:
     Returns:
         Base URL with scheme and host (e.g., 'https://example.com')
     """
+    # Slice scheme and netloc directly; urlparse builds all six components
+    match = _HOST_URL_RE.match(url)
+    if match:
+        return f"{match[1].lower()}://{match[2]}"
+
     parsed = urlparse(url)
     return f"{parsed.scheme}://{parsed.netloc}"
 
@@ -116,10 +153,14 @@ def extract_id_from_url(url: str, pattern: Optional[str] = None) -> Optional[str
         Extracted ID or None
     """
     if pattern:
-        match = re.search(pattern, url)
+        match = _compile(pattern).search(url)
         return match.group(1) if match else None
 
     # Default: extract last path segment
+    path = url_path(url)
+    if path is not None:
+        return path.rstrip('/').rpartition('/')[2] or None
+
     parsed = urlparse(url)
     path_parts = [p for p in parsed.path.split('/') if p]
     return path_parts[-1] if path_parts else None
@@ -152,6 +193,7 @@ def parse_range_string(range_str: str) -> Tuple[int, int]:
         raise ValueError(f"Invalid range values: {range_str}")
 
 
+@lru_cache(maxsize=1024)
 def url_to_slug(url: str) -> str:
     """Convert URL to a reversible, filesystem-safe slug.
 
@@ -0,0 +1,27 @@
+"""Tests for Netscape cookie file parsing."""
+
+from http.cookiejar import CookieJar
+from urllib.request import Request
+
+from pybookget.http.cookies import load_cookies_from_file
+
+
+def test_mixed_case_domain_is_normalized_and_sent(tmp_path):
+    cookie_file = tmp_path / "cookies.txt"
+    cookie_file.write_text(
+        "# Netscape HTTP Cookie File\n"
+        ".Example.COM\tTRUE\t/\tFALSE\t4102444800\tsessionid\tabc123\n"
+    )
+
+    cookies = load_cookies_from_file(str(cookie_file))
+
+    assert len(cookies) == 1
+    assert cookies[0].domain == ".example.com"
+    assert cookies[0].domain_initial_dot
+
+    jar = CookieJar()
+    jar.set_cookie(cookies[0])
+    request = Request("http://www.example.com/page")
+    jar.add_cookie_header(request)
+
+    assert request.get_header("Cookie") == "sessionid=abc123"
@@ -0,0 +1,56 @@
+"""Tests for the IIIF handler."""
+
+import pytest
+
+from pybookget.config import Config
+from pybookget.handlers.iiif import IIIFHandler
+from pybookget.models.iiif import IIIFService
+
+
+@pytest.fixture
+def handler(tmp_path):
+    return IIIFHandler("https://example.org/manifest", Config(download_dir=str(tmp_path)))
+
+
+@pytest.mark.parametrize(
+    "type_, context, profile, expected",
+    [
+        ("ImageService3", None, None, 3),
+        ("ImageService2", None, None, 2),
+        (None, "http://iiif.io/api/image/3/context.json", None, 3),
+        (None, "http://iiif.io/api/image/2/context.json", None, 2),
+        (None, None, "http://iiif.io/api/image/3/level1.json", 3),
+        (None, None, "http://library.stanford.edu/iiif/image-api/1.1/", 2),
+        (None, None, None, 2),
+        # A v1 context has no v2/v3 marker, so the profile decides
+        (
+            None,
+            "http://iiif.io/api/image/1/context.json",
+            "http://iiif.io/api/image/3/level2.json",
+            3,
+        ),
+        # ImageService1 in type falls through to context and profile
+        ("ImageService1", "http://iiif.io/api/image/3/context.json", None, 3),
+        ("ImageService1", None, "http://iiif.io/api/image/3/level0.json", 3),
+        # Earlier fields take priority over later ones
+        (
+            "ImageService2",
+            "http://iiif.io/api/image/3/context.json",
+            "http://iiif.io/api/image/3/level2.json",
+            2,
+        ),
+        (
+            None,
+            "http://iiif.io/api/image/2/context.json",
+            "http://iiif.io/api/image/3/level2.json",
+            2,
+        ),
+    ],
+)
+def test_detect_image_api_version(handler, type_, context, profile, expected):
+    service = IIIFService("https://example.org/iiif/1", type_, profile, context)
+    assert handler._detect_image_api_version(service) == expected
+
+
+def test_detect_image_api_version_without_service(handler):
+    assert handler._detect_image_api_version(None) == 2
@@ -0,0 +1,51 @@
+"""Tests for the RO-Crate writer."""
+
+import json
+
+import pytest
+
+from pybookget.formats.rocrate import RO_CRATE_METADATA_FILE, ROCrateWriter
+from pybookget.models.library import LibraryBook, LibraryMetadata, LibraryPage
+
+
+def _make_book() -> LibraryBook:
+    metadata = LibraryMetadata(
+        creator="Hans Müller",
+        title="Über die Natur",
+        date="1750",
+        contributor="Anna Weber",
+        publisher="Orell Füssli",
+        language="de",
+        rights="Public Domain",
+    )
+    pages = [LibraryPage(order=i, label=str(i), page_id=str(i)) for i in (1, 2)]
+    return LibraryBook(book_id="123", metadata=metadata, pages=pages)
+
+
+def _graph(path):
+    document = json.loads((path / RO_CRATE_METADATA_FILE).read_text(encoding="utf-8"))
+    return document["@context"], {entity["@id"]: entity for entity in document["@graph"]}
+
+
+@pytest.mark.parametrize("include_files", [True, False])
+def test_write_streaming_matches_write(tmp_path, include_files):
+    book = _make_book()
+    results = []
+    for name in ("write", "write_streaming"):
+        out = tmp_path / name
+        images_dir = out / "images"
+        ocr_dir = out / "ocr" / "alto"
+        images_dir.mkdir(parents=True)
+        ocr_dir.mkdir(parents=True)
+        for filename in ("0001.jpg", "0002.jpg"):
+            (images_dir / filename).write_bytes(b"x")
+        (ocr_dir / "0001.xml").write_bytes(b"x")
+
+        writer = ROCrateWriter(include_files=include_files)
+        getattr(writer, name)(book, out, images_dir=images_dir, ocr_dir=out / "ocr")
+        results.append(_graph(out))
+
+    (context, graph), (streamed_context, streamed_graph) = results
+    assert streamed_context == context
+    assert streamed_graph == graph
+    assert ("hasPart" in graph["./"]) is include_files